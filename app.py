@@ -5,7 +5,7 @@ Entry point for the Streamlit web application.
 All 18 bugs from engineering audit addressed:
   BUG-01/02: Gemini HttpOptions fix (in engine.py)
   BUG-03: Refresh button now wired up
-  BUG-04: load_archive cached with ttl=60, cleared after saves
+  BUG-04: archive snapshot cached with ttl=60; new reports show via the in-memory archive
   BUG-05: widget keys sanitized (no hyphens)
   BUG-06: scraper _abs() returns None not '' (in scraper.py)
   BUG-07: YouTube exception handling (in youtube_logic.py)
@@ -22,34 +22,105 @@ All 18 bugs from engineering audit addressed:
   BUG-18: Lazy Supabase import (in engine.py)
 """
 
+import atexit
+import gzip
 import html
 import logging
 import os
-from datetime import datetime as _dt
+import queue
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime as _dt, timedelta as _td
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import streamlit as st
 from dotenv import load_dotenv
 
-from src.scraper import get_latest_meeting, get_meetings_in_range
-from src.youtube_logic import get_transcript
-from src.engine import CouncilEngine
+# Scraper / YouTube / engine modules are imported inside the handlers that
+# use them, so the first paint doesn't wait on requests, bs4 and friends.
+from src.render import (
+    EMPTY_ARCHIVE_HTML,
+    INFO_BOX_HTML,
+    SIDEBAR_FOOTER_HTML,
+    SIDEBAR_HEADER_HTML,
+    archive_cards_html,
+    masthead_html,
+    meeting_cards_html,
+    res_links,
+    summary_html,
+)
+
+if TYPE_CHECKING:
+    from src.engine import CouncilEngine
 
-load_dotenv()
 os.makedirs("logs", exist_ok=True)
+LOG_MAX_BYTES    = 200 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_BUFFER_SIZE  = 512
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("logs/council_app.log", mode="a"),
-    ],
-)
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compresses a rotated-out log file instead of keeping it as plain text."""
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+@st.cache_resource(show_spinner=False)
+def _log_listener() -> QueueListener:
+    """
+    Console + file handlers run on a background QueueListener thread, so
+    request threads only enqueue records instead of blocking on disk I/O.
+    Cached so Streamlit reruns / hot-reloads never start a second listener.
+    """
+    fmt = logging.Formatter(
+        "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    stream_h = logging.StreamHandler()
+    file_h   = RotatingFileHandler(
+        "logs/council_app.log",
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_h.namer   = lambda name: f"{name}.gz"
+    file_h.rotator = _gzip_rotator
+    for h in (stream_h, file_h):
+        h.setFormatter(fmt)
+    # Batch routine records into one write per LOG_BUFFER_SIZE; errors flush immediately
+    buf_h = MemoryHandler(
+        capacity=LOG_BUFFER_SIZE,
+        flushLevel=logging.ERROR,
+        target=file_h,
+        flushOnClose=True,
+    )
+    listener = QueueListener(queue.Queue(-1), stream_h, buf_h, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def flush_logs() -> None:
+    """Forces buffered log records to disk (e.g. before reporting completion)."""
+    for h in _log_listener().handlers:
+        h.flush()
+
+
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_listener().queue)])
 logger = logging.getLogger(__name__)
-logger.info("=" * 60)
-logger.info("Platform starting")
-logger.info("=" * 60)
+# Once per browser session, not on every rerun
+if not st.session_state.get("_boot_logged"):
+    logger.info("=" * 60)
+    logger.info("Platform starting")
+    logger.info("=" * 60)
+    st.session_state["_boot_logged"] = True
 
 st.set_page_config(
     page_title="San Ramon Council Intelligence",
@@ -78,349 +149,479 @@ BACKENDS = {
     },
 }
 
+# Read-only at runtime; the proxies make accidental mutation an error
+BACKENDS = MappingProxyType({k: MappingProxyType(v) for k, v in BACKENDS.items()})
+
 BACKEND_KEYS = list(BACKENDS.keys())
 
+# Flattened (key, label, icon, ctx, speed, env_key) rows for render loops
+BACKEND_ROWS = tuple(
+    (k, cfg["label"], cfg["icon"], cfg["ctx"], cfg["speed"], cfg["env_key"])
+    for k, cfg in BACKENDS.items()
+)
+BACKEND_OPTION_LABELS = {
+    k: f"{icon}  {label}  ·  {ctx}" for k, label, icon, ctx, _speed, _env_key in BACKEND_ROWS
+}
+ENGINE_LABELS = {k: label for k, label, _icon, _ctx, _speed, _env_key in BACKEND_ROWS}
 
-def _safe_key(raw: str) -> str:
-    """BUG-05 FIX: sanitize widget keys to alphanumeric + underscores only."""
-    return re.sub(r"[^a-zA-Z0-9_]", "_", str(raw))
+
+@st.cache_resource(show_spinner=False)
+def _load_env() -> None:
+    """
+    Reads .env once per process. load_dotenv() never overrides variables the
+    platform already set, so it always runs: .env may still hold settings the
+    environment lacks (YOUTUBE_API_KEY, SUMMARIZER_BACKEND, ...).
+    """
+    load_dotenv()
+
+
+_load_env()
+
+
+@st.cache_resource(show_spinner=False)
+def _backend_key_present() -> dict[str, bool]:
+    """Which backends have an API key configured. Re-checked only on Clear Cache."""
+    return {k: bool(os.getenv(v["env_key"])) for k, v in BACKENDS.items()}
 
 
-import re  # noqa: E402 (needed for _safe_key above)
+BACKEND_KEY_PRESENT = _backend_key_present()
+
+
+_KEY_RE = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _safe_key(raw: str) -> str:
+    """BUG-05 FIX: sanitize widget keys to alphanumeric + underscores only."""
+    return _KEY_RE.sub("_", raw if isinstance(raw, str) else str(raw))
 
 
 # ══════════════════════════════════════════════════════════════════
 # CSS
+# static/critical.css (tokens, base, sidebar, masthead) is inlined so the
+# first paint is styled immediately; everything else lives in
+# static/app.css (server.enableStaticServing in .streamlit/config.toml),
+# linked once and cached by the browser.
 # ══════════════════════════════════════════════════════════════════
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Cormorant+Garamond:ital,wght@0,400;0,600;1,400&family=Source+Serif+4:wght@300;400;600&family=IBM+Plex+Mono:wght@300;400;500&display=swap');
-
-:root {
-    --ink:        #1a1f2e;
-    --ink-mid:    #2d3748;
-    --ink-light:  #4a5568;
-    --ink-muted:  #5a6a7a;
-    --paper:      #faf9f6;
-    --paper-1:    #f5f2ec;
-    --paper-2:    #eeeadf;
-    --white:      #ffffff;
-    --gold:       #b07d10;
-    --gold-dk:    #92610a;
-    --gold-lt:    #f5ecd4;
-    --gold-pale:  #fdf8ed;
-    --teal:       #0f6b6b;
-    --teal-lt:    #e8f5f5;
-    --green:      #1a5c2e;
-    --green-lt:   #e8f5ec;
-    /* sidebar palette — all readable on #12161f */
-    --sb-text:    #c8d0de;
-    --sb-muted:   #8a96b0;
-    --sb-dim:     #6a7890;
-    --sb-label:   #7a8ea8;
-    --rad:        7px;
-    --font-d:     'Cormorant Garamond', Georgia, serif;
-    --font-b:     'Source Serif 4', Georgia, serif;
-    --font-m:     'IBM Plex Mono', monospace;
-    --s1: 0 1px 3px rgba(26,31,46,.07);
-    --s2: 0 4px 12px rgba(26,31,46,.09), 0 2px 4px rgba(26,31,46,.06);
-}
-*, *::before, *::after { box-sizing: border-box; }
-html, body, [class*="css"] {
-    font-family: var(--font-b); background: var(--paper); color: var(--ink);
-    -webkit-font-smoothing: antialiased;
-}
-.stApp { background: var(--paper); }
-#MainMenu, footer { visibility: hidden; }
-header { visibility: visible !important; background: transparent !important; }
-hr { border-color: var(--paper-2) !important; margin: 14px 0 !important; }
-::-webkit-scrollbar { width: 4px; }
-::-webkit-scrollbar-track { background: var(--paper-1); }
-::-webkit-scrollbar-thumb { background: var(--paper-2); border-radius: 2px; }
-
-/* ── SIDEBAR ── */
-[data-testid="stSidebar"] {
-    background: #12161f !important;
-    min-width: 270px !important; max-width: 270px !important;
-}
-[data-testid="stSidebar"] > div { padding: 0 !important; }
-/* Reset all sidebar text to a readable muted blue-grey */
-[data-testid="stSidebar"] * { color: var(--sb-muted) !important; }
-
-.sb-brand { padding: 22px 18px 16px; border-bottom: 1px solid #1e2535; margin-bottom: 4px; }
-.sb-brand-title { font-family: var(--font-d) !important; font-size: 1.1rem; color: #f0ece4 !important; font-weight: 600; }
-.sb-brand-sub { font-family: var(--font-m) !important; font-size: 0.57rem; color: var(--gold) !important; letter-spacing: 2px; text-transform: uppercase; margin-top: 3px; }
-/* Section labels — visible on dark */
-.sb-label { font-family: var(--font-m) !important; font-size: 0.55rem !important; color: var(--sb-label) !important; letter-spacing: 2.5px; text-transform: uppercase; padding: 14px 18px 6px; display: block; }
-
-/* Radio as nav list */
-[data-testid="stSidebar"] [data-testid="stRadio"] { display: block !important; }
-[data-testid="stSidebar"] [data-testid="stRadio"] > div { gap: 1px !important; }
-[data-testid="stSidebar"] [data-testid="stRadio"] label {
-    background: transparent !important; border: none !important; border-radius: 0 !important;
-    padding: 9px 18px !important; margin: 0 !important;
-    font-family: var(--font-m) !important; font-size: 0.71rem !important; color: var(--sb-muted) !important;
-    cursor: pointer; display: flex !important; align-items: center !important;
-    border-left: 2px solid transparent !important; transition: all 0.15s !important; width: 100% !important;
-}
-[data-testid="stSidebar"] [data-testid="stRadio"] label:hover {
-    background: rgba(255,255,255,0.03) !important; color: var(--sb-text) !important;
-    border-left-color: rgba(176,125,16,0.4) !important;
-}
-[data-testid="stSidebar"] [data-testid="stRadio"] label:has(input:checked) {
-    color: #e8c060 !important; background: rgba(176,125,16,0.09) !important;
-    border-left-color: var(--gold) !important;
-}
-[data-testid="stSidebar"] [data-baseweb="radio"] { display: none !important; }
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+FONTS_URL = (
+    "https://fonts.googleapis.com/css2?family=Cormorant+Garamond:ital,wght@0,400;0,600;1,400"
+    "&family=Source+Serif+4:wght@300;400;600&family=IBM+Plex+Mono:wght@300;400;500&display=swap"
+)
 
-.key-pill {
-    font-family: var(--font-m); font-size: 0.58rem;
-    padding: 3px 18px 10px; display: flex; align-items: center; gap: 6px;
-}
-.dot-ok   { display:inline-block; width:6px; height:6px; border-radius:50%; background:#22c55e; }
-.dot-miss { display:inline-block; width:6px; height:6px; border-radius:50%; background:#ef4444; }
-.text-ok   { color: #22c55e !important; }
-.text-miss { color: #ef4444 !important; }
-
-[data-testid="stSidebar"] .stButton > button {
-    background: transparent !important; color: var(--sb-muted) !important;
-    border: 1px solid #2a3448 !important; border-radius: 5px !important;
-    font-family: var(--font-m) !important; font-size: 0.62rem !important;
-    letter-spacing: 1px !important; text-transform: uppercase !important;
-    padding: 8px 14px !important; margin: 2px 18px !important;
-    width: calc(100% - 36px) !important; transition: all 0.15s !important; box-shadow: none !important;
-}
-[data-testid="stSidebar"] .stButton > button:hover {
-    border-color: var(--gold) !important; color: var(--gold) !important;
-    background: rgba(176,125,16,0.05) !important;
-}
-/* Sidebar footer — visible on dark background */
-.sb-footer { padding: 12px 18px 20px; font-family: var(--font-m) !important; font-size: 0.56rem; color: var(--sb-dim) !important; line-height: 2.1; }
-
-/* ── MASTHEAD ── */
-.masthead { background: #12161f; padding: 32px 40px 28px; margin: -1rem -1rem 0 -1rem; }
-.mh-flag { display:flex; align-items:center; justify-content:space-between; padding-bottom:13px; margin-bottom:20px; border-bottom:1px solid rgba(176,125,16,0.3); }
-.mh-flag-l { font-family:var(--font-m); font-size:0.6rem; color:var(--gold); letter-spacing:2.5px; text-transform:uppercase; }
-/* date/engine label — was invisible #2d3a50, now readable */
-.mh-flag-r { font-family:var(--font-m); font-size:0.58rem; color:var(--sb-muted); letter-spacing:1.5px; }
-.mh-headline { font-family:var(--font-d); font-size:clamp(2.6rem,4vw,4rem); font-weight:400; color:#f0ece4; line-height:1.0; letter-spacing:-1.5px; margin-bottom:10px; }
-.mh-headline strong { font-weight:600; }
-.mh-headline em { font-style:italic; color:var(--gold); }
-/* tagline — was invisible #4a5a72, now readable */
-.mh-deck { font-family:var(--font-b); font-size:0.92rem; color:var(--sb-text); font-weight:300; line-height:1.6; max-width:520px; margin-bottom:22px; }
-.mh-stats { display:flex; gap:0; border-top:1px solid #1e2535; padding-top:16px; }
-.mh-stat { padding:0 28px 0 0; margin-right:28px; border-right:1px solid #1e2535; }
-.mh-stat:last-child { border-right:none; }
-.mh-stat-n { font-family:var(--font-d); font-size:1.85rem; font-weight:300; color:#f0ece4; line-height:1; }
-/* stat labels — was invisible #2d3a50, now readable */
-.mh-stat-l { font-family:var(--font-m); font-size:0.53rem; color:var(--sb-label); letter-spacing:2px; text-transform:uppercase; margin-top:4px; }
-
-/* ── SECTIONS ── */
-.sec-eyebrow { font-family:var(--font-m); font-size:0.57rem; letter-spacing:2.5px; text-transform:uppercase; color:var(--gold-dk); margin-bottom:12px; padding-bottom:8px; border-bottom:1px solid var(--gold-lt); }
-
-/* ── BUTTONS ── */
-.stButton > button {
-    font-family: var(--font-m) !important; font-size: 0.65rem !important;
-    letter-spacing: 1.2px !important; text-transform: uppercase !important;
-    font-weight: 500 !important; padding: 10px 20px !important;
-    border-radius: var(--rad) !important; border: 1px solid #d4c9a8 !important;
-    background: var(--white) !important; color: var(--gold-dk) !important;
-    transition: all 0.15s !important; box-shadow: var(--s1) !important; width: 100% !important;
-}
-.stButton > button:hover {
-    background: var(--gold-pale) !important; border-color: var(--gold) !important; box-shadow: var(--s2) !important;
-}
-.stButton > button:active { transform: translateY(1px) !important; box-shadow: none !important; }
-div[data-testid="column"] + div[data-testid="column"] .stButton > button {
-    color: var(--ink-mid) !important; border-color: var(--paper-2) !important; background: var(--paper-1) !important;
-}
-div[data-testid="column"] + div[data-testid="column"] .stButton > button:hover {
-    background: var(--paper-2) !important; border-color: var(--ink-light) !important; color: var(--ink) !important;
-}
 
-/* ── REPORT ── */
-.report-shell {
-    background: var(--white);
-    border: 1px solid #e0d8c8;
-    border-top: 4px solid var(--gold);
-    border-radius: var(--rad);
-    box-shadow: var(--s2);
-    overflow: hidden;
-    margin-bottom: 16px;
-}
-.report-top {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 11px 20px;
-    background: var(--paper-1);
-    border-bottom: 1px solid #e0d8c8;
-}
-.rt-date   { font-family: var(--font-m); font-size: 0.62rem; color: var(--gold-dk); font-weight: 500; letter-spacing: 1.5px; text-transform: uppercase; }
-.rt-engine { font-family: var(--font-m); font-size: 0.57rem; color: var(--ink-light); letter-spacing: 1px; }
-.report-body { padding: 22px 26px 18px; color: var(--ink) !important; }
-.report-body h2 {
-    font-family: var(--font-d) !important;
-    font-size: 1.2rem !important;
-    color: var(--ink) !important;
-    border-bottom: 1px solid #e0d8c8 !important;
-    margin-top: 1.4em !important;
-}
-.report-body h2:first-child { margin-top: 0 !important; }
-.report-body p, .report-body li {
-    font-family: var(--font-b) !important;
-    font-size: 1.0rem !important;
-    color: var(--ink-mid) !important;
-    line-height: 1.8 !important;
-}
-.report-body ul { padding-left: 1.4em !important; }
-.report-body strong { color: var(--ink) !important; font-weight: 600 !important; }
-.report-foot {
-    display: flex;
-    gap: 7px;
-    padding: 11px 20px;
-    background: var(--paper-1);
-    border-top: 1px solid #e0d8c8;
-}
+# Fonts are linked directly (with preconnects) rather than @import-ed from
+# app.css, so both stylesheets download in parallel instead of in series.
+STYLESHEET_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="stylesheet" href="{FONTS_URL}">'
+    '<link rel="stylesheet" href="./app/static/app.css">'
+)
 
-/* ── MEETING CARDS ── */
-.meeting-card { background:var(--white); border:1px solid #e0d8c8; border-left:3px solid var(--gold); border-radius:var(--rad); padding:13px 15px 11px; margin-bottom:9px; box-shadow:var(--s1); transition:box-shadow 0.15s; }
-.meeting-card:hover { box-shadow:var(--s2); }
-.mc-date  { font-family:var(--font-m); font-size:0.58rem; color:var(--gold-dk); font-weight:500; letter-spacing:2px; text-transform:uppercase; margin-bottom:4px; }
-.mc-title { font-family:var(--font-d); font-size:0.98rem; color:var(--ink); font-weight:600; margin-bottom:9px; }
-.mc-links { display:flex; gap:5px; flex-wrap:wrap; align-items:center; }
-.mcl { font-family:var(--font-m); font-size:0.57rem; padding:3px 8px; border-radius:3px; text-decoration:none !important; border:1px solid #d4c9a8; color:var(--gold-dk); background:var(--gold-pale); transition:all 0.12s; display:inline-flex; align-items:center; gap:3px; }
-.mcl:hover { background:var(--gold-lt); }
-.mcl.vid { color:var(--teal); background:var(--teal-lt); border-color:#b8d8d8; }
-.mcl.vid:hover { background:#d0ecec; }
-.mcl.min { color:var(--green); background:var(--green-lt); border-color:#b8d8c4; }
-.mcl.min:hover { background:#cce8d8; }
-.mc-badge { font-family:var(--font-m); font-size:0.54rem; padding:2px 6px; border-radius:3px; background:var(--gold-lt); color:var(--gold-dk); border:1px solid #d4c9a8; }
-
-/* ── ARCHIVE ── */
-.arc-card { display:flex; align-items:center; gap:10px; padding:11px 14px; background:var(--white); border:1px solid #e0d8c8; border-radius:var(--rad); margin-bottom:7px; box-shadow:var(--s1); transition:all 0.12s; }
-.arc-card:hover { box-shadow:var(--s2); border-color:#cfc4aa; }
-.arc-dot    { width:7px; height:7px; border-radius:50%; background:var(--gold); flex-shrink:0; }
-.arc-body   { flex:1; min-width:0; }
-.arc-date   { font-family:var(--font-m); font-size:0.59rem; color:var(--gold-dk); letter-spacing:1.5px; text-transform:uppercase; font-weight:500; }
-.arc-title  { font-family:var(--font-b); font-size:0.83rem; color:var(--ink-mid); margin-top:2px; white-space:nowrap; overflow:hidden; text-overflow:ellipsis; }
-/* engine label — was ink-faint #a0aec0, now readable */
-.arc-engine { font-family:var(--font-m); font-size:0.54rem; color:var(--ink-light); margin-top:2px; }
-
-/* ── STATS BAR ── */
-.stats-bar { display:flex; background:var(--white); border:1px solid #e0d8c8; border-radius:var(--rad); overflow:hidden; box-shadow:var(--s1); margin-bottom:18px; }
-.sc { flex:1; padding:14px 16px; border-right:1px solid #e0d8c8; text-align:center; }
-.sc:last-child { border-right:none; }
-.sc-n { font-family:var(--font-d); font-size:1.7rem; font-weight:300; color:var(--ink); line-height:1; }
-/* stat labels — was ink-faint, now readable */
-.sc-l { font-family:var(--font-m); font-size:0.53rem; color:var(--ink-light); letter-spacing:2px; text-transform:uppercase; margin-top:4px; }
-
-/* ── INPUTS ── */
-.stDateInput input { font-family:var(--font-m) !important; font-size:0.78rem !important; border-color:#cec5b0 !important; border-radius:var(--rad) !important; background:var(--white) !important; color:var(--ink) !important; padding:9px 12px !important; }
-.stDateInput input:focus { border-color:var(--gold) !important; box-shadow:0 0 0 3px var(--gold-lt) !important; }
-label[data-testid="stWidgetLabel"] p { font-family:var(--font-m) !important; font-size:0.58rem !important; color:var(--ink-mid) !important; letter-spacing:1.5px !important; text-transform:uppercase !important; }
-
-/* ── STREAMLIT OVERRIDES ── */
-/* caption() text — Streamlit default is very light */
-[data-testid="stCaptionContainer"] p { color: var(--ink-light) !important; font-family: var(--font-m) !important; font-size: 0.72rem !important; }
-[data-testid="stStatusWidget"] { background:var(--white) !important; border:1px solid #e0d8c8 !important; border-radius:var(--rad) !important; font-family:var(--font-m) !important; font-size:0.71rem !important; box-shadow:var(--s1) !important; }
-/* Status widget text inside */
-[data-testid="stStatusWidget"] p, [data-testid="stStatusWidget"] span { color: var(--ink) !important; }
-.stAlert { font-family:var(--font-b) !important; font-size:0.87rem !important; border-radius:var(--rad) !important; }
-.stAlert p { color: var(--ink) !important; }
-.stSpinner > div { border-top-color:var(--gold) !important; }
-/* Streamlit write() and markdown() default text */
-[data-testid="stMarkdownContainer"] p { color: var(--ink-mid) !important; }
-
-/* ── INFO BOX ── */
-.info-box { background:var(--white); border:1px solid #e0d8c8; border-radius:var(--rad); padding:16px 18px; margin-top:16px; box-shadow:var(--s1); }
-.info-box-title { font-family:var(--font-m); font-size:0.57rem; color:var(--gold-dk); letter-spacing:2.5px; text-transform:uppercase; margin-bottom:7px; font-weight:500; }
-.info-box-body  { font-family:var(--font-b); font-size:0.84rem; color:var(--ink-mid); line-height:1.7; }
-
-/* ── EMPTY STATE ── */
-.empty-state { text-align:center; padding:28px 20px; background:var(--white); border:1px dashed #d4c9a8; border-radius:var(--rad); }
-.empty-state-icon { font-size:1.5rem; margin-bottom:8px; opacity:0.6; }
-/* was ink-faint #a0aec0, now readable */
-.empty-state-text { font-family:var(--font-m); font-size:0.63rem; color:var(--ink-light); line-height:1.9; }
-
-/* ── INLINE STYLE OVERRIDES for no-docs / pending spans ── */
-[style*="ink-faint"] { color: var(--ink-light) !important; }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def _critical_style() -> str:
+    """Inlined CSS, minified once per process — it's re-sent over the websocket every rerun."""
+    with open(os.path.join(STATIC_DIR, "critical.css"), encoding="utf-8") as f:
+        css = f.read()
+    try:
+        import rcssmin
+        css = rcssmin.cssmin(css)
+    except ImportError:
+        logger.debug("CSS: rcssmin not installed — inlining unminified")
+    return f"<style>{css}</style>"
+
+
+# st.html skips the markdown pipeline for the inlined CSS; the <link> tags
+# stay on st.markdown since st.html's sanitizer drops them.
+st.html(_critical_style())
+st.markdown(STYLESHEET_LINKS, unsafe_allow_html=True)
 
 
 # ══════════════════════════════════════════════════════════════════
 # HELPERS
 # ══════════════════════════════════════════════════════════════════
 
-def get_engine(backend: str) -> CouncilEngine | None:
-    try:
-        return CouncilEngine(backend=backend)
-    except Exception as e:
-        st.error(f"⚠ Engine init failed: {e}")
-        return None
+@st.cache_resource(show_spinner=False)
+def get_engine(backend: str) -> "CouncilEngine":
+    """
+    One CouncilEngine (and its SDK clients) per backend per process.
+    Init errors propagate so they are shown at the call site, never cached.
+    The engine holds no per-call state, so sharing it across sessions is safe.
+    """
+    from src.engine import CouncilEngine
+    return CouncilEngine(backend=backend)
+
+
+@st.cache_resource(show_spinner=False)
+def supabase_conn():
+    """
+    One Supabase connection (and HTTP session) shared by every archive
+    read and write in the process. ImportError / config errors propagate
+    to the caller and are not cached.
+    """
+    from st_supabase_connection import SupabaseConnection  # BUG-18 FIX: lazy import
+    return st.connection("supabase", type=SupabaseConnection)
+
 
+# Archive list only needs card metadata — the (large) summary body is
+# fetched on demand by load_report() when a report is opened.
+ARCHIVE_COLUMNS = "id,created_at,meeting_date,title,backend_used,agenda_url,minutes_url,webcast_url"
+ARCHIVE_LIMIT   = 50   # rows per fetch; "Load older" pulls the next batch
+ARCHIVE_PAGE_SIZE = 20
 
-@st.cache_data(ttl=60)   # BUG-04 FIX: cache with 60s TTL
-def _load_from_supabase() -> list[dict]:
-    """Pulls archived reports from Supabase. Cached for 60 seconds."""
+
+def _load_from_supabase(offset: int = 0) -> tuple[list[dict], int]:
+    """
+    Pulls one batch of archived report metadata (newest first) from Supabase,
+    rows offset..offset+ARCHIVE_LIMIT-1, plus the table's exact row count.
+    Uncached — see _archive_store() and load_older_reports().
+    """
     try:
-        from st_supabase_connection import SupabaseConnection  # BUG-18 FIX: lazy import
-        conn   = st.connection("supabase", type=SupabaseConnection)
-        result = conn.table("council_reports").select("*").order("created_at", desc=True).execute()
+        conn   = supabase_conn()
+        result = (
+            conn.table("council_reports")
+            .select(ARCHIVE_COLUMNS, count="exact")
+            .order("created_at", desc=True)
+            .range(offset, offset + ARCHIVE_LIMIT - 1)
+            .execute()
+        )
         rows   = result.data or []
-        logger.info(f"Archive: {len(rows)} rows loaded from Supabase")
-        return rows
+        total  = result.count if result.count is not None else offset + len(rows)
+        logger.info(f"Archive: {len(rows)} of {total} rows loaded from Supabase (offset {offset})")
+        return rows, total
     except ImportError:
         logger.debug("Archive: st-supabase-connection not installed — skipping")
-        return []
+        return [], 0
     except Exception as e:
         err = str(e).lower()
         if any(x in err for x in ("nodename", "servname", "connect", "network", "dns", "timeout")):
             logger.debug("Archive: Supabase unreachable (no VPN?) — running in-memory only")
         else:
-            logger.error(f"Archive: Supabase unexpected error — {e}", exc_info=True)
-        return []
+            logger.warning("Archive: Supabase unavailable — %r", e)
+        return [], 0
+
+
+@st.cache_resource(ttl=60, show_spinner=False)   # BUG-04 FIX: cache with 60s TTL
+def _archive_store() -> dict:
+    """
+    Process-wide archive snapshot. cache_resource hands back the same object
+    on every rerun (no pickle round trip like cache_data); callers must treat
+    "rows" as read-only.
+    """
+    rows, total = _load_from_supabase()
+    return {
+        "rows":       rows,
+        "dates":      frozenset(r.get("meeting_date") for r in rows),
+        "count":      total,
+        "fetched_at": time.time(),
+    }
+
+
+def _older_rows(store: dict) -> list[dict]:
+    """Rows this session pulled in with "Load older" — dropped once the snapshot they extend refreshes."""
+    older = st.session_state.get("_archive_older")
+    return older[1] if older and older[0] == store["fetched_at"] else []
+
+
+def load_older_reports() -> None:
+    """Appends the next ARCHIVE_LIMIT archived reports past those already loaded."""
+    store = _archive_store()
+    older = _older_rows(store)
+    rows, _total = _load_from_supabase(len(store["rows"]) + len(older))
+    # Offsets shift if reports were saved since the snapshot — skip repeats
+    seen = {r.get("id") for r in store["rows"]} | {r.get("id") for r in older}
+    st.session_state["_archive_older"] = (
+        store["fetched_at"], older + [r for r in rows if r.get("id") not in seen],
+    )
+
+
+def _select_report(conn, report_id, columns: str) -> dict | None:
+    result = (
+        conn.table("council_reports")
+        .select(columns)
+        .eq("id", report_id)
+        .limit(1)
+        .execute()
+    )
+    rows = result.data or []
+    return rows[0] if rows else None
+
+
+def _fetch_report(conn, report_id) -> tuple[str, str | None] | None:
+    """
+    (summary, summary_html) for one archived report, uncached. summary_html
+    is None for rows saved before that column existed, or when the table
+    hasn't been migrated yet. Connection/query errors propagate.
+    """
+    try:
+        row = _select_report(conn, report_id, "summary,summary_html")
+    except Exception as e:
+        if "summary_html" not in str(e):
+            raise
+        row = _select_report(conn, report_id, "summary")
+    if not row or not row.get("summary"):
+        return None
+    return row["summary"], row.get("summary_html")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_report(report_id) -> tuple[str, str | None] | None:
+    """
+    Fetches (summary, summary_html) for one archived report. Cached for 5
+    minutes. Errors propagate so a failed fetch is never cached — see report_body().
+    """
+    return _fetch_report(supabase_conn(), report_id)
+
+
+PREFETCH_TOP_N   = 3
+PREFETCH_TTL     = 300   # matches load_report()
+PREFETCH_MAX     = 16
+
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=PREFETCH_TOP_N, thread_name_prefix="prefetch")
+
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_store() -> dict:
+    """
+    Process-wide {report_id: (fetched_at, body)} for prefetched bodies, kept
+    apart from load_report()'s cache_data: pool threads have no
+    ScriptRunContext, and only successful fetches land here, so a failed
+    prefetch is simply retried on "View".
+    """
+    return {"bodies": OrderedDict(), "lock": threading.Lock()}
+
+
+def _prefetch_report(conn, report_id, store: dict) -> None:
+    try:
+        body = _fetch_report(conn, report_id)
+    except Exception as e:
+        logger.debug(f"Archive: Prefetch of report {report_id} failed — {e}")
+        return
+    if not body:
+        return
+    with store["lock"]:
+        bodies = store["bodies"]
+        bodies[report_id] = (time.time(), body)
+        bodies.move_to_end(report_id)
+        while len(bodies) > PREFETCH_MAX:
+            bodies.popitem(last=False)
+
+
+def prefetched_body(report_id) -> tuple[str, str | None] | None:
+    """A body fetched by prefetch_recent_bodies(), if it is still fresh."""
+    store = _prefetch_store()
+    with store["lock"]:
+        hit = store["bodies"].get(report_id)
+    if hit and time.time() - hit[0] < PREFETCH_TTL:
+        return hit[1]
+    return None
+
+
+def prefetch_recent_bodies(rows: list[dict], n: int = PREFETCH_TOP_N) -> None:
+    """
+    Fetches the newest few archived report bodies in the background, so the
+    likeliest "View" clicks skip the round trip. Once per id per session.
+    """
+    seen = st.session_state.setdefault("_prefetched", set())
+    todo = [
+        r["id"] for r in rows[:n]
+        if r.get("id") is not None and r["id"] not in seen and "summary" not in r
+    ]
+    if not todo:
+        return
+    try:
+        conn = supabase_conn()   # resolved here, on the script thread
+    except Exception as e:
+        logger.debug(f"Archive: Prefetch skipped — {e}")
+        return
+    pool, store = _prefetch_pool(), _prefetch_store()
+    for rid in todo:
+        pool.submit(_prefetch_report, conn, rid, store)
+        seen.add(rid)
 
 
-def load_archive() -> list[dict]:
+SUMMARY_CACHE_SIZE = 8
+
+
+def report_body(report: dict) -> tuple[str, str | None] | None:
+    """
+    (summary, summary_html) for a report. In-memory reports carry their
+    summary; DB rows are fetched lazily, with the HTML stored at save time.
+    Fetched bodies sit in a per-session LRU of SUMMARY_CACHE_SIZE, so
+    reopening a report skips the cache_data copy without letting the
+    session grow with every report viewed.
+    """
+    if report.get("summary"):
+        return report["summary"], report.get("summary_html")
+    rid   = report.get("id")
+    cache = st.session_state.setdefault("_summary_lru", OrderedDict())
+    if rid in cache:
+        cache.move_to_end(rid)
+        return cache[rid]
+    try:
+        body = prefetched_body(rid) or load_report(rid)
+    except Exception as e:
+        logger.error(f"Archive: Could not load report {rid} — {e}")
+        return None
+    if body:
+        cache[rid] = body
+        while len(cache) > SUMMARY_CACHE_SIZE:
+            cache.popitem(last=False)
+    return body
+
+
+LOOKUP_SCAN = 5  # newest rows checked for a usable report
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _lookup_db_summary(meeting_date: str, backend: str) -> str | None:
     """
-    Returns archived reports, merging Supabase DB rows with
-    in-memory reports added this session (BUG-04 FIX).
+    Most recent usable archived summary for (meeting_date, backend), or None.
+    Rows holding a cascade error message (saved before those were filtered
+    out) are skipped, so they never block a fresh analysis. Errors propagate
+    so an unreachable archive is not cached as "no report" — see _lookup_existing().
     """
-    db_rows = _load_from_supabase()
-    mem     = st.session_state.get("_mem_archive", [])
-    if mem:
-        db_dates = {r.get("meeting_date") for r in db_rows}
-        extras   = [r for r in mem if r.get("meeting_date") not in db_dates]
-        if extras:
-            logger.info(f"Archive: Merging {len(extras)} in-memory report(s)")
-        return extras + db_rows
-    return db_rows
+    from src.engine import is_failure_summary
+    conn   = supabase_conn()
+    result = (
+        conn.table("council_reports")
+        .select("summary")
+        .eq("meeting_date", meeting_date)
+        .eq("backend_used", backend)
+        .order("created_at", desc=True)
+        .limit(LOOKUP_SCAN)
+        .execute()
+    )
+    return next(
+        (r["summary"] for r in result.data or [] if not is_failure_summary(r.get("summary"))),
+        None,
+    )
 
 
-def res_links(meeting: dict, cls: str = "rfl") -> str:
-    """Build HTML resource link chips — agenda, minutes, video. BUG-16 FIX: html.escape()."""
-    h = ""
-    if meeting.get("agenda_url"):
-        h += f'<a class="{cls}" href="{html.escape(meeting["agenda_url"])}" target="_blank">📄 Agenda</a>'
-    if meeting.get("minutes_url"):
-        h += f'<a class="{cls} min" href="{html.escape(meeting["minutes_url"])}" target="_blank">📋 Minutes</a>'
-    if meeting.get("webcast_url"):
-        h += f'<a class="{cls} vid" href="{html.escape(meeting["webcast_url"])}" target="_blank">▶ Video</a>'
-    return h
+def _lookup_existing(meeting_date: str, backend: str) -> str | None:
+    """Checks this session's in-memory reports first, then the Supabase archive."""
+    r = st.session_state.get("_mem_archive", {}).get(meeting_date)
+    if r and r.get("backend_used") == backend:
+        from src.engine import is_failure_summary
+        if not is_failure_summary(r.get("summary")):
+            return r.get("summary")
+    try:
+        return _lookup_db_summary(meeting_date, backend)
+    except Exception as e:
+        logger.debug(f"Archive: Lookup skipped for {meeting_date}/{backend} — {e}")
+        return None
+
+
+VIEWPORT_KEYS = ("current_summary", "current_summary_html", "current_meeting", "current_backend")
+
+
+def show_report(summary: str, meeting: dict, backend: str, body_html: str | None = None) -> None:
+    """
+    Puts a report in the viewport. Uses the HTML stored with the report when
+    there is one; otherwise converts the markdown once here rather than per rerun.
+    """
+    st.session_state.current_summary      = summary
+    st.session_state.current_summary_html = body_html or summary_html(summary)
+    st.session_state.current_meeting      = meeting
+    st.session_state.current_backend      = backend
+
+
+def open_report(report: dict) -> bool:
+    """Loads an archived report into the viewport. Returns False if its body is unavailable."""
+    body = report_body(report)
+    if not body:
+        st.error("⚠ Could not load this report from the archive. Please try again.")
+        return False
+    summary, body_html = body
+    show_report(
+        summary,
+        {
+            "date":        report.get("meeting_date"),
+            "name":        report.get("title"),
+            "agenda_url":  report.get("agenda_url"),
+            "minutes_url": report.get("minutes_url"),
+            "webcast_url": report.get("webcast_url"),
+        },
+        report.get("backend_used", "—"),
+        body_html,
+    )
+    return True
+
+
+def archive_index(rows: list[dict]) -> dict[str, dict]:
+    """
+    {meeting_date: report} over the archive, rebuilt only when load_archive()
+    hands back a different list. The newest report wins for a date, matching
+    the display order.
+    """
+    cached = st.session_state.get("_archive_index")
+    if cached and cached[0] is rows:
+        return cached[1]
+    index = {r.get("meeting_date"): r for r in reversed(rows)}
+    st.session_state["_archive_index"] = (rows, index)
+    return index
 
 
-def run_analysis(meeting: dict, backend: str):
+def load_archive() -> tuple[list[dict], int]:
     """
-    Full pipeline: transcript → AI summary → save → display.
-    BUG-10 FIX: st.rerun() called OUTSIDE the st.status context manager.
+    Returns (loaded archived reports, total report count), merging Supabase
+    DB rows — the first batch plus any "Load older" batches — with in-memory
+    reports added this session (BUG-04 FIX). The total comes from the DB's
+    exact count, so it covers reports not loaded yet.
     """
-    should_rerun = False
+    store   = _archive_store()
+    older   = _older_rows(store)
+    mem     = st.session_state.get("_mem_archive", {})
+    if not mem and not older:
+        return store["rows"], store["count"]
+    # The merge only changes when the DB snapshot or the session's reports do
+    sig    = (id(store), store["fetched_at"], st.session_state.get("_mem_version", 0), len(older))
+    cached = st.session_state.get("_archive_cache")
+    if cached and cached[0] == sig:
+        return cached[1]
+    db_dates = store["dates"].union(r.get("meeting_date") for r in older)
+    extras   = [r for d, r in reversed(mem.items()) if d not in db_dates]
+    if extras:
+        logger.info(f"Archive: Merging {len(extras)} in-memory report(s)")
+    merged = (extras + store["rows"] + older, store["count"] + len(extras))
+    st.session_state["_archive_cache"] = (sig, merged)
+    return merged
+
+
+def run_analysis(meeting: dict, backend: str, force: bool = False):
+    """
+    Full pipeline: transcript → AI summary → save → session state.
+    Runs before the archive, masthead and viewport are rendered, so the
+    result shows up in the same script run — no st.rerun() needed.
+    `force` regenerates even if an archived or cached report exists.
+    Returns True when a report was produced.
+    """
+    # Reuse an archived report for this (meeting, backend) instead of
+    # paying for the transcript fetch + LLM call again.
+    existing = None if force else _lookup_existing(meeting["date"], backend)
+    if existing:
+        logger.info(f"Archive: Reusing {backend} report for {meeting['date']}")
+        show_report(existing, meeting, backend)
+        st.toast("✅ Loaded from archive")
+        return True
 
     with st.status("Starting analysis...", expanded=True) as status:
         status.update(label=f"Searching YouTube for {meeting['date']}...")
-        transcript = get_transcript(meeting["date"])
+        from src.youtube_logic import get_transcript
+        # Engine bootstrap (SDK import + client setup on a cold cache) overlaps
+        # with the YouTube round trips instead of following them.
+        engine, engine_err = None, None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            transcript_future = pool.submit(get_transcript, meeting["date"])
+            try:
+                engine = get_engine(backend)
+            except Exception as e:
+                engine_err = e
+            transcript = transcript_future.result()
 
         if not transcript:
             status.update(label="❌ Transcript not found", state="error")
@@ -431,22 +632,43 @@ def run_analysis(meeting: dict, backend: str):
                 "- Auto-captions not yet generated (check back in 24 hours)\n"
                 "- Try the City YouTube channel manually: search *San Ramon City Council* on YouTube"
             )
-            return  # do NOT rerun — let user see the error
+            return False
 
-        st.write(f"✅ Transcript: **{len(transcript):,} segments**")
-        status.update(label=f"Generating summary with {BACKENDS[backend]['label']}...")
+        status.update(
+            label=f"✅ Transcript ({len(transcript):,} segments) — "
+                  f"generating summary with {ENGINE_LABELS[backend]}..."
+        )
 
-        engine = get_engine(backend)
-        if not engine:
+        if engine_err is not None:
             status.update(label="❌ Engine failed", state="error")
-            return
-
-        summary = engine.generate_summary(meeting, transcript)
-        saved   = CouncilEngine.save_to_supabase(meeting, summary, backend)
-
+            st.error(f"⚠ Engine init failed: {engine_err}")
+            return False
+
+        # Tokens render inside the status panel as they arrive; the formatted
+        # report replaces them in the viewport once the stream completes.
+        outcome = {}
+        summary = st.write_stream(engine.stream_summary(meeting, transcript, outcome, fresh=force))
+        if not outcome.get("complete"):
+            # The text above is a cascade error message or a cut-off stream:
+            # leave it visible, but don't archive or display it as a report.
+            status.update(label="❌ Summary generation failed", state="error", expanded=True)
+            st.error(
+                "⚠ The model did not return a complete summary, so nothing was saved. "
+                "Try again, or switch to another engine in the sidebar."
+            )
+            return False
+        try:
+            conn = supabase_conn()
+        except Exception as e:
+            logger.debug(f"Archive: Supabase connection unavailable — {e!r}")
+            conn = None
+        body_html = summary_html(summary)
+        saved     = engine.save_to_supabase(meeting, summary, backend, conn=conn, summary_html=body_html) if conn else False
+
+        # The archive snapshot is left to its TTL: the in-memory copy below
+        # already shows the new report, so refetching now is a wasted round trip.
         if saved:
-            st.write("✅ Saved to archive")
-            _load_from_supabase.clear()  # BUG-04 FIX: bust Supabase cache
+            _lookup_db_summary.clear()
 
         # Always add to in-memory archive for immediate display (BUG-04 FIX)
         mem_report = {
@@ -454,25 +676,115 @@ def run_analysis(meeting: dict, backend: str):
             "meeting_date": meeting["date"],
             "title":        meeting.get("name", "City Council Meeting"),
             "summary":      summary,
+            "summary_html": body_html,
             "backend_used": backend,
             "agenda_url":   meeting.get("agenda_url"),
             "minutes_url":  meeting.get("minutes_url"),
             "webcast_url":  meeting.get("webcast_url"),
-            "created_at":   _dt.now().isoformat(),
+            "created_at":   time.time(),  # epoch; session-only, never rendered
         }
-        mem = [r for r in st.session_state.get("_mem_archive", [])
-               if r.get("meeting_date") != meeting["date"]]
-        st.session_state["_mem_archive"] = [mem_report] + mem
+        # {meeting_date: report}, oldest first — re-inserting moves a date to the end
+        mem = st.session_state.setdefault("_mem_archive", {})
+        mem.pop(meeting["date"], None)
+        mem[meeting["date"]] = mem_report
+        st.session_state["_mem_version"] = st.session_state.get("_mem_version", 0) + 1
+
+        show_report(summary, meeting, backend, body_html)
+        status.update(
+            label="✅ Analysis complete — saved to archive" if saved else "✅ Analysis complete",
+            state="complete",
+            expanded=False,
+        )
+        flush_logs()
+
+    st.toast("✅ Analysis complete")
+    return True
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def latest_meeting() -> dict | None:
+    """get_latest_meeting(), shared across reruns and sessions for 5 minutes."""
+    from src.scraper import get_latest_meeting
+    return get_latest_meeting()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def meetings_in_range(start_date: str, end_date: str) -> list[dict]:
+    """get_meetings_in_range(), cached per (start, end) for 5 minutes."""
+    from src.scraper import get_meetings_in_range
+    return get_meetings_in_range(start_date, end_date)
 
-        st.session_state.current_summary = summary
-        st.session_state.current_meeting = meeting
-        st.session_state.current_backend = backend
-        status.update(label="✅ Analysis complete", state="complete")
-        should_rerun = True
 
-    # BUG-10 FIX: rerun OUTSIDE the `with st.status` block
-    if should_rerun:
-        st.rerun()
+# Council meets roughly every two weeks; until the next one is due, the
+# latest meeting can't change, so it's rechecked at most once an hour.
+MEETING_CADENCE_DAYS = 14
+LATEST_RECHECK_SECS  = 3600
+
+
+def latest_meeting_gated() -> dict | None:
+    """latest_meeting(), skipped entirely while no new meeting is expected."""
+    cached = st.session_state.get("latest_gate")
+    if cached:
+        fetched_at, meeting, next_expected = cached
+        if (time.time() - fetched_at < LATEST_RECHECK_SECS
+                and _dt.now().date() < next_expected - _td(days=1)):
+            return meeting
+    meeting = latest_meeting()
+    if meeting:
+        next_expected = _dt.strptime(meeting["iso"], "%Y-%m-%d").date() + _td(days=MEETING_CADENCE_DAYS)
+        st.session_state.latest_gate = (time.time(), meeting, next_expected)
+    return meeting
+
+
+def clear_meeting_cache() -> None:
+    from src.scraper import expire_feed_cache
+    expire_feed_cache()
+    latest_meeting.clear()
+    meetings_in_range.clear()
+    st.session_state.pop("latest_gate", None)
+
+
+LATEST_MEETING = "latest"
+
+
+def set_archive_page(page: int) -> None:
+    """Button/filter callback: moves the archive list to the given page."""
+    st.session_state.arch_page = max(0, page)
+
+
+def queue_analysis(meeting: dict | str, force: bool = False) -> None:
+    """
+    Records the meeting to analyze (or LATEST_MEETING). The buttons call this
+    inline and then st.rerun(), so the request is picked up at the top of
+    the main area in the next run and processed ahead of everything it
+    affects. `force` regenerates instead of reusing an archived report.
+    """
+    st.session_state.pending_analysis = meeting
+    st.session_state.pending_force    = force
+
+
+def process_pending_analysis(backend: str) -> None:
+    pending = st.session_state.pop("pending_analysis", None)
+    force   = st.session_state.pop("pending_force", False)
+    if pending is not None:
+        _analyze_pending(pending, backend, force)
+
+
+def _analyze_pending(pending: dict | str, backend: str, force: bool = False) -> None:
+    if pending == LATEST_MEETING:
+        with st.status("Fetching meeting calendar...", expanded=True) as s:
+            meeting = latest_meeting_gated()
+            if not meeting:
+                s.update(label="❌ No recent meetings found", state="error")
+                st.error(
+                    "No City Council meetings found in the last 90 days.\n\n"
+                    "Note: Only meetings with published agendas appear in the RSS feed."
+                )
+                return
+            st.write(f"✅ **Found:** {html.escape(meeting['name'])} — {html.escape(meeting['date'])}")
+    else:
+        meeting = pending
+    run_analysis(meeting, backend, force)
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -480,14 +792,7 @@ def run_analysis(meeting: dict, backend: str):
 # BUG-14 FIX: sidebar must render before masthead reads backend_choice
 # ══════════════════════════════════════════════════════════════════
 with st.sidebar:
-    st.markdown("""
-    <div class="sb-brand">
-        <div class="sb-brand-title">🏛️ Council Intelligence</div>
-        <div class="sb-brand-sub">San Ramon, CA</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown('<span class="sb-label">AI Engine</span>', unsafe_allow_html=True)
+    st.html(SIDEBAR_HEADER_HTML)
 
     # BUG-09 FIX: safe fallback if session_state has an invalid key
     saved_backend = st.session_state.get("backend_radio", "gemini")
@@ -499,103 +804,101 @@ with st.sidebar:
     backend_choice = st.radio(
         "Select engine",
         options=BACKEND_KEYS,
-        format_func=lambda k: f"{BACKENDS[k]['icon']}  {BACKENDS[k]['label']}  ·  {BACKENDS[k]['ctx']}",
+        format_func=BACKEND_OPTION_LABELS.__getitem__,
         index=default_idx,
         label_visibility="collapsed",
         key="backend_radio",
     )
 
     cfg     = BACKENDS[backend_choice]
-    key_set = bool(os.getenv(cfg["env_key"]))
+    key_set = BACKEND_KEY_PRESENT[backend_choice]
     d_cls   = "dot-ok"  if key_set else "dot-miss"
     t_cls   = "text-ok" if key_set else "text-miss"
     k_msg   = f"{cfg['env_key']} set" if key_set else f"{cfg['env_key']} missing"
 
-    st.markdown(f"""
+    # Key pill, divider and section label go out as one delta instead of three
+    st.html(f"""
     <div class="key-pill">
         <span class="{d_cls}"></span>
         <span class="{t_cls}">{k_msg}</span>
     </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown('<hr style="border-color:#1e2535;margin:6px 0">', unsafe_allow_html=True)
-    st.markdown('<span class="sb-label">Controls</span>', unsafe_allow_html=True)
-
-    if st.button("⟳  Clear Cache", use_container_width=False):
-        _load_from_supabase.clear()
+    <hr style="border-color:#1e2535;margin:6px 0">
+    <span class="sb-label">Controls</span>
+    """)
+
+    if st.button("⟳  Clear Cache", type="primary", use_container_width=False):
+        _archive_store.clear()
+        clear_meeting_cache()
+        get_engine.clear()
+        load_dotenv()  # picks up newly added keys; platform-set ones still win
+        from src.engine import clear_response_cache, clear_secret_cache
+        clear_secret_cache()
+        clear_response_cache()
+        _backend_key_present.clear()
+        BACKEND_KEY_PRESENT = _backend_key_present()
         st.session_state.pop("_mem_archive", None)
+        st.session_state.pop("_archive_cache", None)
+        st.session_state.pop("_archive_older", None)
+        st.session_state.pop("_summary_lru", None)
+        st.session_state.pop("_prefetched", None)
+        _prefetch_store.clear()
         st.session_state.pop("range_meetings", None)
         st.success("Cache and memory cleared")
 
-    st.markdown('<hr style="border-color:#1e2535;margin:6px 0">', unsafe_allow_html=True)
-    st.markdown("""
-    <div class="sb-footer">
-        Source · IQM2 RSS Feed<br>
-        Video · YouTube API<br>
-        Storage · Supabase<br>
-        Version · 1.0.0<br>
-        Logs · logs/council_app.log
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(SIDEBAR_FOOTER_HTML)
+
+
+# ══════════════════════════════════════════════════════════════════
+# LAYOUT
+# The masthead slot is reserved first but filled after any queued
+# analysis has run, so its report count already includes the result.
+# ══════════════════════════════════════════════════════════════════
+masthead_slot = st.empty()
+
+st.html("<div style='height:24px'></div>")
+
+col_left, col_right = st.columns([11, 7], gap="large")
+
+with col_left:
+    st.html('<div class="sec-eyebrow">Intelligence Viewport</div>')
+    process_pending_analysis(backend_choice)
 
 
 # ══════════════════════════════════════════════════════════════════
 # DATA (loaded AFTER sidebar so backend_choice is resolved)
 # BUG-14 FIX: data + masthead rendered after sidebar
 # ══════════════════════════════════════════════════════════════════
-archived_all = load_archive()
-cfg          = BACKENDS[backend_choice]
-key_set      = bool(os.getenv(cfg["env_key"]))
+archived_all, archive_total = load_archive()
+prefetch_recent_bodies(archived_all)
+key_set      = BACKEND_KEY_PRESENT[backend_choice]  # re-read: Clear Cache may have refreshed it
 today_str    = _dt.now().strftime("%B %d, %Y").upper()
 
 
 # ══════════════════════════════════════════════════════════════════
 # MASTHEAD
 # ══════════════════════════════════════════════════════════════════
-st.markdown(f"""
-<div class="masthead">
-  <div class="mh-flag">
-    <span class="mh-flag-l">San Ramon, CA &nbsp;·&nbsp; Civic Intelligence</span>
-    <span class="mh-flag-r">{today_str} &nbsp;·&nbsp; {html.escape(cfg['label'].upper())}</span>
-  </div>
-  <div class="mh-headline"><strong>Council</strong> <em>Intelligence</em></div>
-  <div class="mh-deck">AI-powered analysis of every San Ramon City Council meeting — votes, fiscal decisions, and public commentary distilled into a 30-second brief.</div>
-  <div class="mh-stats">
-    <div class="mh-stat"><div class="mh-stat-n">{len(archived_all)}</div><div class="mh-stat-l">Reports</div></div>
-    <div class="mh-stat"><div class="mh-stat-n">{'✓' if key_set else '✗'}</div><div class="mh-stat-l">{'Engine Ready' if key_set else 'Key Missing'}</div></div>
-    <div class="mh-stat"><div class="mh-stat-n">~30s</div><div class="mh-stat-l">Time to Insight</div></div>
-    <div class="mh-stat"><div class="mh-stat-n">4h+</div><div class="mh-stat-l">Video Replaced</div></div>
-  </div>
-</div>
-""", unsafe_allow_html=True)
-
-st.markdown("<div style='height:24px'></div>", unsafe_allow_html=True)
-
-col_left, col_right = st.columns([11, 7], gap="large")
+masthead_slot.html(masthead_html(today_str, cfg["label"], archive_total, key_set))
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # LEFT — Intelligence Viewport
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-with col_left:
-    st.markdown('<div class="sec-eyebrow">Intelligence Viewport</div>', unsafe_allow_html=True)
-
+# A fragment, so clearing the report reruns only the viewport. Actions that
+# also touch the masthead or archive (analysis, refresh) still rerun the app.
+@st.fragment
+def render_viewport() -> None:
     if "current_summary" in st.session_state:
         meta    = st.session_state.get("current_meeting", {})
         backend = st.session_state.get("current_backend", "—")
         links   = res_links(meta)
 
         safe_date   = html.escape(str(meta.get("date", "—")))
-        safe_engine = html.escape(BACKENDS.get(backend, {}).get("label", backend).upper())
+        safe_engine = html.escape(ENGINE_LABELS.get(backend, backend).upper())
 
         # Convert markdown to HTML and render the ENTIRE report in ONE st.markdown call.
         # Splitting across multiple calls causes Streamlit to close divs independently —
         # summary content never lands inside .report-body so CSS selectors never apply.
-        import markdown as _md
-        summary_html = _md.markdown(
-            st.session_state.current_summary,
-            extensions=["extra", "nl2br"],
-        )
+        body_html = st.session_state.get("current_summary_html") or summary_html(st.session_state.current_summary)
         no_docs = '<span style="font-family:var(--font-m);font-size:.58rem;color:var(--ink-light)">No documents on record for this meeting</span>'
         st.markdown(f"""
         <div class="report-shell">
@@ -604,7 +907,7 @@ with col_left:
             <span class="rt-engine">via {safe_engine}</span>
           </div>
           <div class="report-body">
-            {summary_html}
+            {body_html}
           </div>
           <div class="report-foot">
             {links or no_docs}
@@ -612,166 +915,176 @@ with col_left:
         </div>
         """, unsafe_allow_html=True)
 
-        if st.button("✕  Clear Viewport"):
-            for k in ["current_summary", "current_meeting", "current_backend"]:
+        va, vb = st.columns(2)
+        if va.button("✕  Clear Viewport", type="secondary"):
+            for k in VIEWPORT_KEYS:
                 st.session_state.pop(k, None)
+            st.rerun(scope="fragment")
+        # Re-runs the pipeline with the sidebar engine, bypassing the archive
+        # and response caches — e.g. when a saved report is poor or stale.
+        if vb.button(f"↻  Regenerate · {ENGINE_LABELS[backend_choice]}", type="secondary"):
+            queue_analysis(meta, force=True)
             st.rerun()
 
     else:
         c1, c2 = st.columns([3, 1])
-        analyze = c1.button("▶  Analyze Latest Meeting", use_container_width=True)
-        refresh = c2.button("⟳  Refresh", use_container_width=True)   # BUG-03 FIX: now handled
+        # A click here only reruns the fragment, which would skip the queued
+        # analysis at the top of the page — so queue it and rerun the app.
+        analyze = c1.button(
+            "▶  Analyze Latest Meeting",
+            type="primary",
+            use_container_width=True,
+        )
+        refresh = c2.button("⟳  Refresh", type="secondary", use_container_width=True)   # BUG-03 FIX: now handled
+
+        if analyze:
+            queue_analysis(LATEST_MEETING)
+            st.rerun()
 
         if refresh:
             st.session_state.pop("range_meetings", None)
-            _load_from_supabase.clear()
+            _archive_store.clear()
+            clear_meeting_cache()
             st.rerun()
 
-        if analyze:
-            with st.status("Fetching meeting calendar...", expanded=True) as s:
-                meeting = get_latest_meeting()
-                if not meeting:
-                    s.update(label="❌ No recent meetings found", state="error")
-                    st.error(
-                        "No City Council meetings found in the last 90 days.\n\n"
-                        "Note: Only meetings with published agendas appear in the RSS feed."
-                    )
-                    st.stop()
-                st.write(f"✅ **Found:** {html.escape(meeting['name'])} — {html.escape(meeting['date'])}")
-            run_analysis(meeting, backend_choice)
-
-        st.markdown("""
-        <div class="info-box">
-          <div class="info-box-title">How It Works</div>
-          <div class="info-box-body">
-            Meetings are sourced from the IQM2 RSS feed (published agendas only).
-            Transcripts are fetched from the City's YouTube channel automatically.
-            Use the <strong>Meeting Browser</strong> to the right to analyze any past session.
-            Each card shows direct links to the Agenda PDF, Minutes, and Video recording.
-          </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(INFO_BOX_HTML)
+
+with col_left:
+    render_viewport()
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # RIGHT — Archive + Browser
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-with col_right:
-
-    st.markdown('<div class="sec-eyebrow">Archived Reports</div>', unsafe_allow_html=True)
+# Each panel is a fragment: paging, picking, and loading meetings rerun only
+# that panel. Actions that change the masthead or viewport call st.rerun().
+@st.fragment
+def render_archive(archived_all: list[dict], total: int) -> None:
+    st.html('<div class="sec-eyebrow">Archived Reports</div>')
 
     if archived_all:
         latest = archived_all[0].get("meeting_date", "—")
         n_eng  = len(set(r.get("backend_used", "") for r in archived_all))
-        st.markdown(f"""
+        st.html(f"""
         <div class="stats-bar">
-          <div class="sc"><div class="sc-n">{len(archived_all)}</div><div class="sc-l">Reports</div></div>
+          <div class="sc"><div class="sc-n">{total}</div><div class="sc-l">Reports</div></div>
           <div class="sc"><div class="sc-n">{n_eng}</div><div class="sc-l">Engines</div></div>
           <div class="sc"><div class="sc-n" style="font-size:.85rem;padding-top:6px">{html.escape(latest)}</div><div class="sc-l">Latest</div></div>
         </div>
-        """, unsafe_allow_html=True)
-
-        for report in archived_all:
-            eng_label = BACKENDS.get(report.get("backend_used", ""), {}).get(
-                "label", report.get("backend_used", "—")
+        """)
+
+        n_pages = max(1, -(-len(archived_all) // ARCHIVE_PAGE_SIZE))
+        page    = min(st.session_state.get("arch_page", 0), n_pages - 1)
+        start   = page * ARCHIVE_PAGE_SIZE
+
+        page_rows = archived_all[start:start + ARCHIVE_PAGE_SIZE]
+        st.html(archive_cards_html(tuple(
+            (
+                r.get("meeting_date", "—"),
+                r.get("title", "City Council Meeting"),
+                ENGINE_LABELS.get(r.get("backend_used", ""), r.get("backend_used", "—")),
+            )
+            for r in page_rows
+        )))
+
+        # One picker + one button instead of a View widget per card
+        va, vb = st.columns([5, 2])
+        pick = va.selectbox(
+            "Open report",
+            range(len(page_rows)),
+            format_func=lambda i: f'{page_rows[i].get("meeting_date", "—")} · {page_rows[i].get("title", "City Council Meeting")}',
+            key="arch_pick",
+            label_visibility="collapsed",
+        )
+        if vb.button("View →", key="arch_view", type="secondary", use_container_width=True):
+            if pick is not None and open_report(page_rows[pick]):
+                st.rerun()
+
+        if n_pages > 1:
+            pa, pb, pc = st.columns([2, 3, 2])
+            pa.button(
+                "← Prev", key="arch_prev", type="secondary", use_container_width=True,
+                disabled=page == 0, on_click=set_archive_page, args=(page - 1,),
+            )
+            pb.html(f'<p style="font-family:var(--font-m);font-size:0.72rem;color:var(--ink-light);text-align:center;margin:8px 0">Page {page + 1} of {n_pages}</p>')
+            pc.button(
+                "Next →", key="arch_next", type="secondary", use_container_width=True,
+                disabled=page >= n_pages - 1, on_click=set_archive_page, args=(page + 1,),
             )
-            # BUG-05 FIX: sanitize key, BUG-16 FIX: escape title
-            safe_id    = _safe_key(str(report.get("id", "unknown")))
-            safe_title = html.escape(report.get("title", "City Council Meeting"))
-            safe_date  = html.escape(report.get("meeting_date", "—"))
-            safe_eng   = html.escape(eng_label)
-
-            ca, cb = st.columns([5, 2])
-            with ca:
-                st.markdown(f"""
-                <div class="arc-card">
-                  <div class="arc-dot"></div>
-                  <div class="arc-body">
-                    <div class="arc-date">{safe_date}</div>
-                    <div class="arc-title">{safe_title}</div>
-                    <div class="arc-engine">via {safe_eng}</div>
-                  </div>
-                </div>
-                """, unsafe_allow_html=True)
-            with cb:
-                if st.button("View →", key=f"arch_{safe_id}"):  # BUG-05 FIX
-                    st.session_state.current_summary = report["summary"]
-                    st.session_state.current_meeting = {
-                        "date":        report.get("meeting_date"),
-                        "name":        report.get("title"),
-                        "agenda_url":  report.get("agenda_url"),
-                        "minutes_url": report.get("minutes_url"),
-                        "webcast_url": report.get("webcast_url"),
-                    }
-                    st.session_state.current_backend = report.get("backend_used", "—")
-                    st.rerun()
-    else:
-        st.markdown("""
-        <div class="empty-state">
-          <div class="empty-state-icon">🗂</div>
-          <div class="empty-state-text">No archived reports yet.<br>Analyze a meeting below to begin.</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
-
-    # ── Meeting Browser ──────────────────────────────────
-    st.markdown('<div class="sec-eyebrow">Meeting Browser</div>', unsafe_allow_html=True)
 
-    d1, d2 = st.columns(2)
-    start_val = d1.date_input("From", key="s_in")
-    end_val   = d2.date_input("To",   key="e_in")
+        # The masthead and browser read the loaded rows too, so this reruns the app
+        if len(archived_all) < total and st.button(
+            f"Load older reports ({total - len(archived_all)} more)",
+            key="arch_older", type="secondary", use_container_width=True,
+        ):
+            load_older_reports()
+            st.rerun()
+    else:
+        st.html(EMPTY_ARCHIVE_HTML)
+
+
+@st.fragment
+def render_browser(archived_all: list[dict]) -> None:
+    archive_by_date = archive_index(archived_all)
+    archive_dates   = archive_by_date.keys()
+
+    # A form buffers date edits so only the submit triggers a rerun
+    with st.form("daterange_form", clear_on_submit=False, border=False):
+        d1, d2 = st.columns(2)
+        start_val = d1.date_input("From", key="s_in")
+        end_val   = d2.date_input("To",   key="e_in")
+        submitted = st.form_submit_button(
+            "▶  Load Meetings in Range",
+            type="primary",
+            use_container_width=True,
+            on_click=set_archive_page,
+            args=(0,),
+        )
 
-    if st.button("▶  Load Meetings in Range", use_container_width=True):
+    range_key = (start_val.strftime("%Y-%m-%d"), end_val.strftime("%Y-%m-%d"))
+    if submitted:
         with st.spinner("Fetching from RSS feed..."):
-            found = get_meetings_in_range(
-                start_val.strftime("%Y-%m-%d"),
-                end_val.strftime("%Y-%m-%d"),
-            )
+            found = meetings_in_range(*range_key)
         st.session_state.range_meetings = found or []
         if not found:
             st.warning("No City Council meetings found in that date range.")
 
     if st.session_state.get("range_meetings"):
-        meetings      = st.session_state.range_meetings
-        archive_dates = {r.get("meeting_date") for r in archived_all}
-        st.markdown(f'<p style="font-family:var(--font-m);font-size:0.72rem;color:var(--ink-light);margin:4px 0">{len(meetings)} meeting(s) · RSS feed — published agendas only</p>', unsafe_allow_html=True)
-        st.markdown("<div style='height:4px'></div>", unsafe_allow_html=True)
-
-        for i, m in enumerate(meetings):
-            already    = m["date"] in archive_dates
-            card_links = res_links(m, cls="mcl")
-            # BUG-16 FIX: escape meeting name
-            safe_name  = html.escape(m.get("name", "City Council"))
-            safe_mdate = html.escape(m["date"])
-            badge      = '<span class="mc-badge">✓ Archived</span>' if already else ""
-            no_links   = '<span style="font-family:var(--font-m);font-size:.56rem;color:var(--ink-light)">Documents pending publication</span>'
-
-            st.markdown(f"""
-            <div class="meeting-card">
-              <div class="mc-date">{safe_mdate}</div>
-              <div class="mc-title">{safe_name} {badge}</div>
-              <div class="mc-links">{card_links or no_links}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            btn_label = "✓ View Report" if already else "▶ Analyze & Archive"
-            if st.button(btn_label, key=f"rng_{i}", use_container_width=True):
-                if already:
-                    match = next(
-                        (r for r in archived_all if r.get("meeting_date") == m["date"]),
-                        None,
-                    )
-                    if match:
-                        st.session_state.current_summary = match["summary"]
-                        st.session_state.current_meeting = {
-                            "date":        match.get("meeting_date"),
-                            "name":        match.get("title"),
-                            "agenda_url":  match.get("agenda_url"),
-                            "minutes_url": match.get("minutes_url"),
-                            "webcast_url": match.get("webcast_url"),
-                        }
-                        st.session_state.current_backend = match.get("backend_used", "—")
-                        st.rerun()
-                else:
-                    run_analysis(m, backend_choice)
+        meetings = st.session_state.range_meetings
+        st.html(f'<p style="font-family:var(--font-m);font-size:0.72rem;color:var(--ink-light);margin:4px 0">{len(meetings)} meeting(s) · RSS feed — published agendas only</p>')
+        st.html("<div style='height:4px'></div>")
+
+        # st.markdown, not st.html: the sanitizer behind st.html drops target="_blank"
+        st.markdown(meeting_cards_html(tuple(
+            (m["date"], m.get("name", "City Council"), m["date"] in archive_dates, res_links(m, cls="mcl"))
+            for m in meetings
+        )), unsafe_allow_html=True)
+
+        # One picker + one action button instead of a button per card
+        ma, mb = st.columns([5, 3])
+        pick = ma.selectbox(
+            "Meeting",
+            range(len(meetings)),
+            format_func=lambda i: f'{meetings[i]["date"]} · {meetings[i].get("name", "City Council")}',
+            key="rng_pick",
+            label_visibility="collapsed",
+        )
+        if pick is None:
+            return
+        m = meetings[pick]
+        if m["date"] in archive_dates:
+            if mb.button("✓ View Report", key="rng_view", type="primary", use_container_width=True):
+                match = archive_by_date.get(m["date"])
+                if match and open_report(match):
+                    st.rerun()
+        else:
+            # Analysis updates the masthead and viewport, so it needs a full rerun
+            if mb.button("▶ Analyze & Archive", key="rng_analyze", type="primary", use_container_width=True):
+                queue_analysis(m)
+                st.rerun()
+
+with col_right:
+    render_archive(archived_all, archive_total)
+    st.html("<div style='height:6px'></div>")
+    st.html('<div class="sec-eyebrow">Meeting Browser</div>')
+    render_browser(archived_all)
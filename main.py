@@ -1,12 +1,14 @@
 import os
 from dotenv import load_dotenv
+
+# Load API keys from .env before importing src.*, which reads settings
+# such as DEBUG at import time
+load_dotenv()
+
 from src.scraper import get_latest_meeting
 from src.youtube_logic import get_transcript
 from src.engine import CouncilEngine
 
-# Load API keys from .env
-load_dotenv()
-
 def run_pipeline():
     print("🚀 Initializing San Ramon Intelligence Pipeline...")
     
@@ -25,7 +27,11 @@ def run_pipeline():
     # 3. Generate AI Summary
     print("🧠 Analyzing transcript with Groq AI (Llama 3.3)...")
     engine = CouncilEngine()
-    summary = engine.generate_summary(meeting, transcript)
+    try:
+        summary = engine.generate_summary(meeting, transcript)
+    except RuntimeError as e:
+        print(f"❌ Summary generation failed: {e}")
+        return
     
     print("\n" + "="*40)
     print(f"FINAL SUMMARY: {meeting['date']}")
@@ -4,22 +4,33 @@ San Ramon Council Intelligence Platform
 
 Model cascade strategy:
   - Every backend tries a priority-ordered list of models
-  - On 404 / model-not-found / rate-limit → automatically tries next model
+  - On 404 / model-not-found → automatically tries next model; a rate limit
+    is retried with backoff first (see _call_llm)
   - Final fallback returns a clear user-facing error (never a silent blank)
 
 OpenRouter free models are volatile by design — cascades are mandatory.
 """
 
 import os
+import re
+import hashlib
 import logging
+import random
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import streamlit as st
-from dotenv import load_dotenv
 
-load_dotenv()
+# .env is loaded by the entrypoint (app.py / main.py), not on import here
 logger = logging.getLogger(__name__)
 
+# Full tracebacks are costly to format; only emit them when debugging
+LOG_TRACEBACKS = bool(os.getenv("DEBUG"))
+
 SUPPORTED_BACKENDS = ("groq_llama", "gemini", "trinity", "deepseek_r1")
 
 # ── Model cascade lists (tried in order, first success wins) ──────────────────
@@ -61,50 +72,324 @@ _MODEL_GONE_SIGNALS = (
     "no provider",
 )
 _RATE_LIMIT_SIGNALS = ("rate_limit", "429", "too many requests")
+_QUOTA_SIGNALS      = ("insufficient_quota", "billing")
+_AUTH_SIGNALS       = ("invalid_api_key", "authentication")
+_UNAVAILABLE_SIGNALS = ("503", "unavailable")
+
+
+def _signal_re(signals: tuple[str, ...]) -> re.Pattern:
+    """One compiled alternation per signal family — a single scan per check."""
+    return re.compile("|".join(map(re.escape, signals)))
+
+
+_MODEL_GONE_RE  = _signal_re(_MODEL_GONE_SIGNALS)
+_RATE_LIMIT_RE  = _signal_re(_RATE_LIMIT_SIGNALS)
+_QUOTA_RE       = _signal_re(_QUOTA_SIGNALS)
+_AUTH_RE        = _signal_re(_AUTH_SIGNALS)
+_UNAVAILABLE_RE = _signal_re(_UNAVAILABLE_SIGNALS)
+
+# Every message a cascade yields instead of a summary (see _stream_*) starts
+# like this: "**Groq Error:** ..." or "**Trinity — All models unavailable.**"
+_FAILURE_RE = re.compile(r"\*\*(?:\w+ Error:\*\*|[^*\n]+ — All models unavailable\.\*\*)")
+
+
+def is_failure_summary(text: str | None) -> bool:
+    """True for empty text or a cascade error message — never a report to keep."""
+    return not text or not text.strip() or _FAILURE_RE.match(text.lstrip()) is not None
+
+
+# Resolved secrets, per process. Misses aren't cached so a key added later
+# is still picked up; clear_secret_cache() forgets everything (Clear Cache).
+_secret_cache: dict[str, str] = {}
 
 
 def _get_secret(key: str) -> str | None:
+    value = _secret_cache.get(key)
+    if value:
+        return value
     value = os.getenv(key)
     if not value:
         try:
             value = st.secrets.get(key)
         except Exception:
             pass
+    if value:
+        _secret_cache[key] = value
     return value
 
 
+def clear_secret_cache() -> None:
+    _secret_cache.clear()
+
+
+@lru_cache(maxsize=1)
+def _http_client():
+    """
+    One pooled httpx client for the Groq and OpenRouter SDKs, so every
+    engine in the process reuses warm TLS connections. The SDKs still set
+    their own per-request timeouts.
+    """
+    import httpx  # installed with groq / openai
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
 def _is_model_gone(msg: str) -> bool:
-    return any(s in msg for s in _MODEL_GONE_SIGNALS)
+    return _MODEL_GONE_RE.search(msg) is not None
 
 
 def _is_rate_limit(msg: str) -> bool:
-    return any(s in msg for s in _RATE_LIMIT_SIGNALS)
+    return _RATE_LIMIT_RE.search(msg) is not None
+
+
+# Rate-limit waits: the provider's Retry-After when given, else exponential
+# backoff with full jitter so concurrent sessions don't retry in lockstep.
+# A rate-limited model is retried up to RATE_LIMIT_RETRIES times before the
+# cascade moves on; all waits in one cascade share CASCADE_BACKOFF_BUDGET.
+BACKOFF_BASE = 1.0
+BACKOFF_CAP  = 30.0
+RATE_LIMIT_RETRIES     = 4
+CASCADE_BACKOFF_BUDGET = 45.0
+
+
+def _rate_limit_wait(e: Exception, retry: int) -> float | None:
+    """
+    Seconds to wait before retrying a rate-limited model, or None to move on
+    now: a Retry-After past BACKOFF_CAP is a quota window, not a burst.
+    """
+    headers = getattr(getattr(e, "response", None), "headers", None) or {}
+    try:
+        retry_after = float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        retry_after = None
+    if retry_after is not None:
+        return max(retry_after, 0.0) if retry_after <= BACKOFF_CAP else None
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** retry))
+
+
+def _peek(pieces: Iterator[str | None]) -> tuple[str | None, Iterator[str | None]]:
+    """
+    Pulls the first non-empty piece of a response stream. Request errors
+    surface here, while the cascade can still fall through to the next model.
+    """
+    for piece in pieces:
+        if piece:
+            return piece, pieces
+    return None, pieces
+
+
+def _drain(first: str, rest: Iterator[str | None], label: str) -> Generator[str, None, bool]:
+    """
+    Yields a stream once committed to a model; a mid-stream failure ends it
+    early. Returns True only if the stream ran to completion.
+    """
+    yield first
+    try:
+        for piece in rest:
+            if piece:
+                yield piece
+    except Exception as e:
+        logger.error(f"Engine: {label} stream interrupted — {e}")
+        return False
+    return True
+
+
+def _call_llm(
+    models: list[str],
+    label: str,
+    client_fn: Callable[[str], Iterator[str | None]],
+    exhausted: str,
+    fatal: Callable[[str], str | None] | None = None,
+) -> Generator[str, None, bool | None]:
+    """
+    Runs one backend's model cascade: streams from the first model in
+    `models` that returns content. client_fn(model) sends the request and
+    returns its text pieces. A rate-limited model is retried with backoff
+    (see _rate_limit_wait); unavailable or failing models are skipped.
+    fatal(msg) may return a user-facing message that ends the cascade at
+    once (e.g. a bad key); `exhausted` is yielded when every model failed.
+    Returns True for a complete stream, False if it was cut off, and None
+    after yielding an error message.
+    """
+    budget = CASCADE_BACKOFF_BUDGET
+    for model in models:
+        name = f"{label} '{model}'"
+        for retry in range(RATE_LIMIT_RETRIES + 1):
+            logger.info(f"Engine: Trying {name}")
+            try:
+                # Whitespace-only keep-alive pieces don't count as content
+                first, rest = _peek(client_fn(model))
+                while first is not None and not first.strip():
+                    first, rest = _peek(rest)
+            except Exception as e:
+                msg = str(e).lower()
+                if fatal and (message := fatal(msg)):
+                    yield message
+                    return None
+                if _is_rate_limit(msg):
+                    wait = _rate_limit_wait(e, retry) if retry < RATE_LIMIT_RETRIES else None
+                    if wait is not None and wait <= budget:
+                        budget -= wait
+                        logger.warning(f"Engine: {name} rate limited — retrying in {wait:.1f}s")
+                        time.sleep(wait)
+                        continue
+                    logger.warning(f"Engine: {name} rate limited — trying next")
+                elif _UNAVAILABLE_RE.search(msg) or _is_model_gone(msg):
+                    logger.warning(f"Engine: {name} unavailable — trying next")
+                else:
+                    logger.error(f"Engine: {name} error: {e}")
+                break
+            if first is None:
+                logger.warning(f"Engine: {name} returned empty content — trying next")
+                break
+            logger.info(f"Engine: {name} streaming")
+            return (yield from _drain(first, rest, name))
+    yield exhausted
+    return None
+
+
+# ── Response cache ────────────────────────────────────────────────────────────
+# Completed summaries keyed on sha256(backend | prompt). Every backend runs at
+# temperature 0.1, so a repeat of the same prompt gets the stored text instead
+# of another paid call. Error messages and cut-off streams are never stored.
+RESPONSE_CACHE_TTL  = 4 * 3600
+RESPONSE_CACHE_SIZE = 32
+_response_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_response_lock = threading.Lock()
+
+
+def _response_key(backend: str, prompt: str) -> str:
+    return hashlib.sha256(f"{backend}|{prompt}".encode()).hexdigest()
+
+
+def _cached_response(key: str) -> str | None:
+    with _response_lock:
+        hit = _response_cache.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > RESPONSE_CACHE_TTL:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return hit[1]
+
+
+def _store_response(key: str, text: str) -> None:
+    with _response_lock:
+        _response_cache[key] = (time.monotonic(), text)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    with _response_lock:
+        _response_cache.clear()
+
+
+def _caching_stream(
+    key: str, stream: Generator[str, None, bool | None], outcome: dict | None = None,
+) -> Iterator[str]:
+    """
+    Passes a backend stream through, storing the text if it completed.
+    outcome["complete"] is set once the stream ends: False for a cascade
+    error message or a stream cut off mid-way.
+    """
+    parts: list[str] = []
+    while True:
+        try:
+            piece = next(stream)
+        except StopIteration as done:
+            complete = bool(done.value)
+            if outcome is not None:
+                outcome["complete"] = complete
+            if complete:
+                _store_response(key, "".join(parts))
+            return
+        parts.append(piece)
+        yield piece
+
+
+# Fixed scaffold of every prompt; only the date and document notes vary.
+_PROMPT_HEAD_TMPL = (
+    "You are a senior municipal reporter covering a San Ramon City Council meeting on {date}.\n"
+    "{agenda_note}{minutes_note}\n"
+    "Produce a structured civic intelligence report with EXACTLY these sections:\n\n"
+    "## Executive Summary\n2-3 sentences on the meeting's most significant outcomes.\n\n"
+    "## Key Votes & Decisions\nBullet list of every formal vote. Include vote counts if mentioned.\n\n"
+    "## Fiscal Impact\nSpending, contracts, or budget commitments. Write 'None discussed' if absent.\n\n"
+    "## Public Commentary\nNotable themes from public comment. Who spoke and on what topics.\n\n"
+    "## Next Steps & Deadlines\nFollow-up actions or future agenda items mentioned.\n\n"
+    "RULES: Start immediately with ## Executive Summary. Facts only. No preamble.\n\n"
+    "TRANSCRIPT:\n"
+)
 
 
-def build_prompt(meeting: dict, text_snippet: str) -> str:
-    agenda_note  = f"Official agenda: {meeting['agenda_url']}\n"  if meeting.get("agenda_url")  else ""
-    minutes_note = f"Official minutes: {meeting['minutes_url']}\n" if meeting.get("minutes_url") else ""
-    return (
-        f"You are a senior municipal reporter covering a San Ramon City Council meeting on {meeting['date']}.\n"
-        f"{agenda_note}{minutes_note}\n"
-        f"Produce a structured civic intelligence report with EXACTLY these sections:\n\n"
-        f"## Executive Summary\n2-3 sentences on the meeting's most significant outcomes.\n\n"
-        f"## Key Votes & Decisions\nBullet list of every formal vote. Include vote counts if mentioned.\n\n"
-        f"## Fiscal Impact\nSpending, contracts, or budget commitments. Write 'None discussed' if absent.\n\n"
-        f"## Public Commentary\nNotable themes from public comment. Who spoke and on what topics.\n\n"
-        f"## Next Steps & Deadlines\nFollow-up actions or future agenda items mentioned.\n\n"
-        f"RULES: Start immediately with ## Executive Summary. Facts only. No preamble.\n\n"
-        f"TRANSCRIPT:\n{text_snippet}"
+def _prompt_head(meeting: dict) -> str:
+    """Everything in the prompt up to (not including) the transcript text."""
+    return _PROMPT_HEAD_TMPL.format(
+        date=meeting["date"],
+        agenda_note=f"Official agenda: {meeting['agenda_url']}\n" if meeting.get("agenda_url") else "",
+        minutes_note=f"Official minutes: {meeting['minutes_url']}\n" if meeting.get("minutes_url") else "",
     )
 
 
+def build_prompt(meeting: dict, text_snippet: str) -> str:
+    return _prompt_head(meeting) + text_snippet
+
+
+def _transcript_pieces(transcript: list[dict], max_chars: int) -> list[str]:
+    """
+    Segment texts that fit in max_chars once space-joined; the last one is cut
+    to fit. Trimming happens before any join, so an oversized transcript is
+    never materialized in full.
+    """
+    texts: list[str] = []
+    total = -1  # joined length so far; the first segment adds no separator
+    for t in transcript:
+        text = t["text"]
+        if total + 1 + len(text) > max_chars:
+            remaining = max_chars - total - 1
+            if remaining > 0:
+                texts.append(text[:remaining])
+            logger.warning(f"Engine: Trimming to {max_chars:,} chars after {len(texts):,} segments")
+            break
+        texts.append(text)
+        total += 1 + len(text)
+    return texts
+
+
 def prepare_transcript(transcript: list[dict], max_chars: int) -> str:
-    full = " ".join(t["text"] for t in transcript)
-    logger.info(f"Engine: Transcript = {len(full):,} chars")
-    if len(full) > max_chars:
-        logger.warning(f"Engine: Trimming to {max_chars:,} chars")
-        return full[:max_chars]
-    return full
+    joined = " ".join(_transcript_pieces(transcript, max_chars))
+    logger.info(f"Engine: Transcript = {len(joined):,} chars")
+    return joined
+
+
+def build_prompt_from_transcript(meeting: dict, transcript: list[dict], max_chars: int) -> str:
+    """
+    build_prompt(meeting, prepare_transcript(...)) in one join: the header and
+    the trimmed segments go into a single allocation, with no snippet copy.
+    """
+    parts = [_prompt_head(meeting)]
+    for i, text in enumerate(_transcript_pieces(transcript, max_chars)):
+        if i:
+            parts.append(" ")
+        parts.append(text)
+    return "".join(parts)
+
+
+SAVE_BATCH_SIZE = 100  # rows per Supabase insert request
+
+
+@st.cache_resource(show_spinner=False)
+def _supabase_conn():
+    """
+    Connection for callers that don't pass one (app.py passes its own).
+    Built once per process; ImportError / config errors propagate uncached.
+    """
+    from st_supabase_connection import SupabaseConnection
+    return st.connection("supabase", type=SupabaseConnection)
 
 
 class CouncilEngine:
@@ -133,36 +418,29 @@ class CouncilEngine:
         key = _get_secret("GROQ_API_KEY")
         if not key:
             raise ValueError("GROQ_API_KEY not found")
-        self._groq = Groq(api_key=key)
+        self._groq = Groq(api_key=key, http_client=_http_client())
         logger.info(f"Engine: Groq ready (cascade: {GROQ_MODELS})")
 
-    def _summarize_groq(self, prompt: str) -> str:
+    def _stream_groq(self, prompt: str) -> Generator[str, None, bool | None]:
         system = "You are a senior political analyst. Report facts only. Use clean Markdown with ## headers and bullet points."
-        for model in GROQ_MODELS:
-            logger.info(f"Engine: Trying Groq model '{model}'")
-            try:
-                result = self._groq.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system},
-                        {"role": "user",   "content": prompt},
-                    ],
-                    temperature=0.1,
-                    max_tokens=2000,
-                ).choices[0].message.content
-                logger.info(f"Engine: Groq '{model}' succeeded")
-                return result
-            except Exception as e:
-                msg = str(e).lower()
-                if _is_rate_limit(msg):
-                    logger.warning(f"Engine: Groq '{model}' rate limited — waiting 5s")
-                    time.sleep(5)
-                elif _is_model_gone(msg):
-                    logger.warning(f"Engine: Groq '{model}' unavailable — trying next")
-                else:
-                    logger.error(f"Engine: Groq '{model}' error: {e}")
-                continue
-        return "**Groq Error:** All Groq models currently unavailable. Please switch to Gemini."
+
+        def request(model: str) -> Iterator[str | None]:
+            stream = self._groq.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user",   "content": prompt},
+                ],
+                temperature=0.1,
+                max_tokens=2000,
+                stream=True,
+            )
+            return (c.choices[0].delta.content for c in stream if c.choices)
+
+        return (yield from _call_llm(
+            GROQ_MODELS, "Groq", request,
+            "**Groq Error:** All Groq models currently unavailable. Please switch to Gemini.",
+        ))
 
     # ── Gemini ─────────────────────────────────────────────────────────────────
     def _init_gemini(self):
@@ -176,32 +454,24 @@ class CouncilEngine:
         )
         logger.info(f"Engine: Gemini ready (cascade: {GEMINI_MODELS})")
 
-    def _summarize_gemini(self, prompt: str) -> str:
+    def _stream_gemini(self, prompt: str) -> Generator[str, None, bool | None]:
         system = (
             "You are a concise civic reporter. Start immediately with ## Executive Summary. "
             "Use clean Markdown with ## section headers and bullet points. No preamble."
         )
         full_prompt = f"{system}\n\n{prompt}"
-        for model in GEMINI_MODELS:
-            logger.info(f"Engine: Trying Gemini model '{model}'")
-            try:
-                result = self._gemini_client.models.generate_content(
-                    model=model,
-                    contents=full_prompt,
-                ).text
-                logger.info(f"Engine: Gemini '{model}' succeeded")
-                return result
-            except Exception as e:
-                msg = str(e).lower()
-                if _is_rate_limit(msg):
-                    logger.warning(f"Engine: Gemini '{model}' rate limited — waiting 5s")
-                    time.sleep(5)
-                elif "503" in msg or "unavailable" in msg or _is_model_gone(msg):
-                    logger.warning(f"Engine: Gemini '{model}' unavailable — trying next")
-                else:
-                    logger.error(f"Engine: Gemini '{model}' error: {e}")
-                continue
-        return "**Gemini Error:** All Gemini models currently unavailable. Please switch to Llama."
+
+        def request(model: str) -> Iterator[str | None]:
+            stream = self._gemini_client.models.generate_content_stream(
+                model=model,
+                contents=full_prompt,
+            )
+            return (chunk.text for chunk in stream)
+
+        return (yield from _call_llm(
+            GEMINI_MODELS, "Gemini", request,
+            "**Gemini Error:** All Gemini models currently unavailable. Please switch to Llama.",
+        ))
 
     # ── OpenRouter (Trinity + DeepSeek) ────────────────────────────────────────
     def _init_openrouter(self):
@@ -212,6 +482,7 @@ class CouncilEngine:
         self._or_client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=key,
+            http_client=_http_client(),
             default_headers={
                 "HTTP-Referer": "https://abhijeetsant-city-council-intelligence.streamlit.app",
                 "X-Title":      "San Ramon Council Intelligence",
@@ -223,81 +494,143 @@ class CouncilEngine:
         }[self.backend]
         logger.info(f"Engine: OpenRouter ready | backend={self.backend} | cascade={self._or_cascade}")
 
-    def _summarize_openrouter(self, prompt: str) -> str:
+    def _stream_openrouter(self, prompt: str) -> Generator[str, None, bool | None]:
         system = (
             "You are an expert City Clerk. Produce executive-level civic reports in clean Markdown. "
             "Start with ## Executive Summary. No preamble."
         )
-        for model in self._or_cascade:
-            logger.info(f"Engine: Trying OpenRouter model '{model}'")
-            try:
-                result = self._or_client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system},
-                        {"role": "user",   "content": prompt},
-                    ],
-                    temperature=0.1,
-                ).choices[0].message.content
-
-                if not result or not result.strip():
-                    logger.warning(f"Engine: OpenRouter '{model}' returned empty content — trying next")
-                    continue
-
-                logger.info(f"Engine: OpenRouter '{model}' succeeded ({len(result):,} chars)")
-                return result
 
-            except Exception as e:
-                msg = str(e).lower()
-                if _is_model_gone(msg):
-                    logger.warning(f"Engine: OpenRouter '{model}' gone (404) — trying next in cascade")
-                elif _is_rate_limit(msg):
-                    logger.warning(f"Engine: OpenRouter '{model}' rate limited — waiting 5s")
-                    time.sleep(5)
-                elif "insufficient_quota" in msg or "billing" in msg:
-                    return "**Quota Error:** OpenRouter account has insufficient credits. Add credits at openrouter.ai."
-                elif "invalid_api_key" in msg or "authentication" in msg:
-                    return "**Auth Error:** Invalid OPENROUTER_API_KEY. Check your Streamlit secrets."
-                else:
-                    logger.error(f"Engine: OpenRouter '{model}' unexpected error: {e}")
-                continue
+        def request(model: str) -> Iterator[str | None]:
+            stream = self._or_client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user",   "content": prompt},
+                ],
+                temperature=0.1,
+                stream=True,
+            )
+            return (c.choices[0].delta.content for c in stream if c.choices)
+
+        def fatal(msg: str) -> str | None:
+            # Account problems hit every model alike — no point walking the cascade
+            if _QUOTA_RE.search(msg):
+                return "**Quota Error:** OpenRouter account has insufficient credits. Add credits at openrouter.ai."
+            if _AUTH_RE.search(msg):
+                return "**Auth Error:** Invalid OPENROUTER_API_KEY. Check your Streamlit secrets."
+            return None
 
         backend_label = "DeepSeek R1" if self.backend == "deepseek_r1" else "Trinity"
         tried = " → ".join(self._or_cascade)
-        return (
+        return (yield from _call_llm(
+            self._or_cascade, "OpenRouter", request,
             f"**{backend_label} — All models unavailable.**\n\n"
             f"Cascade tried: {tried}\n\n"
-            f"OpenRouter free endpoints are volatile. Please switch to **Gemini** or **Llama** instead."
-        )
+            f"OpenRouter free endpoints are volatile. Please switch to **Gemini** or **Llama** instead.",
+            fatal,
+        ))
 
     # ── Dispatcher ─────────────────────────────────────────────────────────────
-    def generate_summary(self, meeting: dict, transcript: list[dict]) -> str:
-        limit   = self.CONTEXT_LIMITS[self.backend]
-        snippet = prepare_transcript(transcript, limit)
-        prompt  = build_prompt(meeting, snippet)
+    def stream_summary(
+        self, meeting: dict, transcript: list[dict], outcome: dict | None = None, fresh: bool = False,
+    ) -> Iterator[str]:
+        """
+        Yields the summary as the model produces it (e.g. for st.write_stream).
+        Pass an `outcome` dict to learn, once the stream is consumed, whether
+        it was a complete summary (outcome["complete"]) — a cascade error
+        message or a cut-off stream must not be saved as a report.
+        `fresh` skips the response cache (a forced regeneration).
+        """
+        prompt = build_prompt_from_transcript(meeting, transcript, self.CONTEXT_LIMITS[self.backend])
         logger.info(f"Engine: Prompt={len(prompt):,} chars | backend={self.backend}")
-        return {
-            "groq_llama":  self._summarize_groq,
-            "gemini":      self._summarize_gemini,
-            "trinity":     self._summarize_openrouter,
-            "deepseek_r1": self._summarize_openrouter,
-        }[self.backend](prompt)
+        key    = _response_key(self.backend, prompt)
+        cached = None if fresh else _cached_response(key)
+        if cached is not None:
+            logger.info(f"Engine: Response cache hit | backend={self.backend}")
+            if outcome is not None:
+                outcome["complete"] = True
+            return iter((cached,))
+        return _caching_stream(key, {
+            "groq_llama":  self._stream_groq,
+            "gemini":      self._stream_gemini,
+            "trinity":     self._stream_openrouter,
+            "deepseek_r1": self._stream_openrouter,
+        }[self.backend](prompt), outcome)
+
+    def generate_summary(self, meeting: dict, transcript: list[dict]) -> str:
+        """
+        stream_summary() joined into one string. Raises RuntimeError instead
+        of returning a cascade error message or a stream that was cut off.
+        """
+        outcome: dict = {}
+        summary = "".join(self.stream_summary(meeting, transcript, outcome))
+        if not outcome.get("complete"):
+            if is_failure_summary(summary):
+                raise RuntimeError(summary.strip() or f"{self.backend}: empty summary")
+            raise RuntimeError(f"{self.backend}: summary stream cut off after {len(summary):,} chars")
+        return summary
 
     @staticmethod
-    def save_to_supabase(meeting: dict, summary: str, backend: str) -> bool:
-        try:
-            from st_supabase_connection import SupabaseConnection
-            conn = st.connection("supabase", type=SupabaseConnection)
-            conn.table("council_reports").insert({
-                "meeting_date": meeting["date"],
-                "title":        meeting.get("name", "City Council Meeting"),
-                "summary":      summary,
-                "backend_used": backend,
-                "agenda_url":   meeting.get("agenda_url"),
-                "minutes_url":  meeting.get("minutes_url"),
-                "webcast_url":  meeting.get("webcast_url"),
-            }).execute()
+    def report_row(meeting: dict, summary: str, backend: str, summary_html: str | None = None) -> dict:
+        """One council_reports row; `summary_html` is stored alongside the markdown when given."""
+        row = {
+            "meeting_date": meeting["date"],
+            "title":        meeting.get("name", "City Council Meeting"),
+            "summary":      summary,
+            "backend_used": backend,
+            "agenda_url":   meeting.get("agenda_url"),
+            "minutes_url":  meeting.get("minutes_url"),
+            "webcast_url":  meeting.get("webcast_url"),
+        }
+        if summary_html is not None:
+            row["summary_html"] = summary_html
+        return row
+
+    @staticmethod
+    def save_to_supabase(
+        meeting: dict, summary: str, backend: str, conn=None, summary_html: str | None = None,
+    ) -> bool:
+        """
+        Inserts one report. Pass a shared `conn` to reuse its HTTP session.
+        `summary_html` is stored alongside the markdown so archive views can
+        render it as-is.
+        """
+        row = CouncilEngine.report_row(meeting, summary, backend, summary_html)
+        saved = CouncilEngine.save_many_to_supabase([row], conn=conn)
+        if saved:
             logger.info(f"Engine: Saved {meeting['date']} to Supabase")
+        return saved
+
+    @staticmethod
+    def save_many_to_supabase(rows: list[dict], conn=None) -> bool:
+        """
+        Inserts report rows (see report_row) in batches of SAVE_BATCH_SIZE,
+        one request per batch over one connection — e.g. for a backfill.
+        Tables without the summary_html column get the rows without it.
+        """
+        kept = [r for r in rows if not is_failure_summary(r.get("summary"))]
+        if len(kept) < len(rows):
+            logger.warning(f"Engine: Not saving {len(rows) - len(kept)} failed summary row(s)")
+        rows = kept
+        if not rows:
+            return True
+        try:
+            if conn is None:
+                conn = _supabase_conn()
+            table = conn.table("council_reports")
+            for i in range(0, len(rows), SAVE_BATCH_SIZE):
+                batch = rows[i:i + SAVE_BATCH_SIZE]
+                try:
+                    table.insert(batch).execute()
+                except Exception as e:
+                    if "summary_html" not in str(e):
+                        raise
+                    logger.warning("Engine: council_reports has no summary_html column — saving without it")
+                    rows  = [{k: v for k, v in r.items() if k != "summary_html"} for r in rows]
+                    batch = rows[i:i + SAVE_BATCH_SIZE]
+                    table.insert(batch).execute()
+            if len(rows) > 1:
+                logger.info(f"Engine: Saved {len(rows)} reports to Supabase")
             return True
         except ImportError:
             logger.debug("Engine: st-supabase-connection not installed — skipping save")
@@ -307,5 +640,29 @@ class CouncilEngine:
             if any(x in err for x in ("nodename", "servname", "connect", "network", "dns", "timeout")):
                 logger.debug("Engine: Supabase unreachable (no VPN?) — in-memory only")
             else:
-                logger.error(f"Engine: Supabase save failed — {e}", exc_info=True)
+                logger.error(f"Engine: Supabase save failed — {e!r}", exc_info=LOG_TRACEBACKS)
             return False
+
+
+def generate_summaries_multi(
+    meeting: dict, transcript: list[dict], backends: tuple[str, ...] | list[str] = SUPPORTED_BACKENDS,
+) -> dict[str, str | Exception]:
+    """
+    Summarizes one meeting with several backends at once, e.g. to feed
+    SummaryEvaluator. The calls are network-bound, so threads overlap the
+    providers' latencies and the total is about the slowest backend rather
+    than the sum. Returns {backend: summary}, or the exception a backend
+    raised (init failure, failed or cut-off summary) in place of its summary.
+    """
+    def run(backend: str) -> str | Exception:
+        try:
+            return CouncilEngine(backend=backend).generate_summary(meeting, transcript)
+        except Exception as e:
+            logger.error(f"Engine: '{backend}' failed in multi-backend run — {e!r}")
+            return e
+
+    backends = list(dict.fromkeys(backends))
+    if not backends:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(backends), thread_name_prefix="llm") as pool:
+        return dict(zip(backends, pool.map(run, backends)))
@@ -1,6 +1,7 @@
-import pandas as pd
+import csv
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 
 class SummaryEvaluator:
@@ -36,8 +37,28 @@ class SummaryEvaluator:
                 "Date":       datetime.date.today(),  # BUG-F FIX: was missing on error path
             }
 
+    def score_many(self, items):
+        """
+        Scores several (transcript, summary, model_name) triples at once.
+        Each score is one network-bound Gemini call, so running them on
+        threads makes the batch take about as long as the slowest call.
+        Results come back in input order.
+        """
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(items), 8)) as pool:
+            return list(pool.map(lambda item: self.score_summary(*item), items))
+
+    CSV_PATH   = "logs/model_evaluation.csv"
+    CSV_FIELDS = ("Model", "Evaluation", "Date")
+
     def save_comparison(self, results_list):
-        import os as _os
-        _os.makedirs("logs", exist_ok=True)
-        df = pd.DataFrame(results_list)
-        df.to_csv("logs/model_evaluation.csv", index=False, mode='a')
+        """Appends rows to CSV_PATH; the header is written only when the file is new."""
+        os.makedirs("logs", exist_ok=True)
+        is_new = not os.path.exists(self.CSV_PATH) or os.path.getsize(self.CSV_PATH) == 0
+        with open(self.CSV_PATH, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.CSV_FIELDS, extrasaction="ignore")
+            if is_new:
+                writer.writeheader()
+            writer.writerows(results_list)
@@ -0,0 +1,168 @@
+"""
+render.py — HTML fragment builders
+San Ramon Council Intelligence Platform
+
+Pure string builders used by app.py. They live in an imported module
+(not the Streamlit script) so their lru_caches survive reruns — app.py
+itself is re-executed top to bottom on every interaction.
+"""
+
+import html
+from functools import lru_cache
+from string import Template
+
+from markdown_it import MarkdownIt
+
+RESOURCE_KEYS = ("agenda_url", "minutes_url", "webcast_url")
+
+# Raw HTML in LLM output is escaped rather than passed through, and
+# markdown-it's link validator rejects javascript:/data: URLs.
+_MD = MarkdownIt("commonmark", {"html": False, "breaks": True}).enable(["table", "strikethrough"])
+
+
+@lru_cache(maxsize=256)
+def _links_cached(cls: str, items: tuple[tuple[str, str | None], ...]) -> str:
+    """Renders the link chips for one (cls, urls) combination — memoized across reruns."""
+    escape = html.escape
+    urls   = dict(items)
+    parts  = []
+    if a := urls.get("agenda_url"):
+        parts.append(f'<a class="{cls}" href="{escape(a)}" target="_blank">📄 Agenda</a>')
+    if m := urls.get("minutes_url"):
+        parts.append(f'<a class="{cls} min" href="{escape(m)}" target="_blank">📋 Minutes</a>')
+    if v := urls.get("webcast_url"):
+        parts.append(f'<a class="{cls} vid" href="{escape(v)}" target="_blank">▶ Video</a>')
+    return "".join(parts)
+
+
+def res_links(meeting: dict, cls: str = "rfl") -> str:
+    """Build HTML resource link chips — agenda, minutes, video. BUG-16 FIX: html.escape()."""
+    return _links_cached(cls, tuple((k, meeting.get(k)) for k in RESOURCE_KEYS))
+
+
+# ── Static chrome — identical on every rerun ────────────────────────
+SIDEBAR_HEADER_HTML = """
+<div class="sb-brand">
+    <div class="sb-brand-title">🏛️ Council Intelligence</div>
+    <div class="sb-brand-sub">San Ramon, CA</div>
+</div>
+<span class="sb-label">AI Engine</span>
+"""
+
+SIDEBAR_FOOTER_HTML = """
+<hr style="border-color:#1e2535;margin:6px 0">
+<div class="sb-footer">
+    Source · IQM2 RSS Feed<br>
+    Video · YouTube API<br>
+    Storage · Supabase<br>
+    Version · 1.0.0<br>
+    Logs · logs/council_app.log
+</div>
+"""
+
+INFO_BOX_HTML = """
+<div class="info-box">
+  <div class="info-box-title">How It Works</div>
+  <div class="info-box-body">
+    Meetings are sourced from the IQM2 RSS feed (published agendas only).
+    Transcripts are fetched from the City's YouTube channel automatically.
+    Use the <strong>Meeting Browser</strong> to the right to analyze any past session.
+    Each card shows direct links to the Agenda PDF, Minutes, and Video recording.
+  </div>
+</div>
+"""
+
+EMPTY_ARCHIVE_HTML = """
+<div class="empty-state">
+  <div class="empty-state-icon">🗂</div>
+  <div class="empty-state-text">No archived reports yet.<br>Analyze a meeting below to begin.</div>
+</div>
+"""
+
+
+# Static masthead markup; only the $-placeholders change between reruns
+_MASTHEAD_TMPL = Template("""
+<div class="masthead">
+  <div class="mh-flag">
+    <span class="mh-flag-l">San Ramon, CA &nbsp;·&nbsp; Civic Intelligence</span>
+    <span class="mh-flag-r">$today &nbsp;·&nbsp; $engine</span>
+  </div>
+  <div class="mh-headline"><strong>Council</strong> <em>Intelligence</em></div>
+  <div class="mh-deck">AI-powered analysis of every San Ramon City Council meeting — votes, fiscal decisions, and public commentary distilled into a 30-second brief.</div>
+  <div class="mh-stats">
+    <div class="mh-stat"><div class="mh-stat-n">$n_archived</div><div class="mh-stat-l">Reports</div></div>
+    <div class="mh-stat"><div class="mh-stat-n">$key_dot</div><div class="mh-stat-l">$key_label</div></div>
+    <div class="mh-stat"><div class="mh-stat-n">~30s</div><div class="mh-stat-l">Time to Insight</div></div>
+    <div class="mh-stat"><div class="mh-stat-n">4h+</div><div class="mh-stat-l">Video Replaced</div></div>
+  </div>
+</div>
+""")
+
+
+def masthead_html(today: str, engine_label: str, n_archived: int, key_set: bool) -> str:
+    """Fills the masthead template. BUG-16 FIX: engine label is escaped."""
+    return _MASTHEAD_TMPL.substitute(
+        today=today,
+        engine=html.escape(engine_label.upper()),
+        n_archived=n_archived,
+        key_dot="✓" if key_set else "✗",
+        key_label="Engine Ready" if key_set else "Key Missing",
+    )
+
+
+_ARCHIVE_CARD = """<div class="arc-card">
+  <div class="arc-dot"></div>
+  <div class="arc-body">
+    <div class="arc-date">{date}</div>
+    <div class="arc-title">{title}</div>
+    <div class="arc-engine">via {engine}</div>
+  </div>
+</div>"""
+
+
+@lru_cache(maxsize=1024)
+def _card_html(date: str, title: str, engine: str) -> str:
+    """One archive card — memoized, since archived reports rarely change. BUG-16 FIX: all fields escaped."""
+    return _ARCHIVE_CARD.format(
+        date=html.escape(date),
+        title=html.escape(title),
+        engine=html.escape(engine),
+    )
+
+
+@lru_cache(maxsize=32)
+def archive_cards_html(cards: tuple[tuple[str, str, str], ...]) -> str:
+    """Renders (date, title, engine) rows as one HTML blob — memoized per page."""
+    return "".join(_card_html(*card) for card in cards)
+
+
+@lru_cache(maxsize=64)
+def summary_html(md: str) -> str:
+    """Markdown → HTML for the report body, converted once per distinct summary."""
+    return _MD.render(md)
+
+
+_MEETING_CARD = """<div class="meeting-card">
+  <div class="mc-date">{date}</div>
+  <div class="mc-title">{name} {badge}</div>
+  <div class="mc-links">{links}</div>
+</div>"""
+_ARCHIVED_BADGE = '<span class="mc-badge">✓ Archived</span>'
+_NO_LINKS = '<span style="font-family:var(--font-m);font-size:.56rem;color:var(--ink-light)">Documents pending publication</span>'
+
+
+@lru_cache(maxsize=32)
+def meeting_cards_html(cards: tuple[tuple[str, str, bool, str], ...]) -> str:
+    """
+    Renders (date, name, archived, links_html) rows as one HTML blob.
+    links_html comes from res_links() and is already escaped. BUG-16 FIX: name escaped.
+    """
+    return "".join(
+        _MEETING_CARD.format(
+            date=html.escape(date),
+            name=html.escape(name),
+            badge=_ARCHIVED_BADGE if archived else "",
+            links=links or _NO_LINKS,
+        )
+        for date, name, archived, links in cards
+    )
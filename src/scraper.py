@@ -16,17 +16,63 @@ from datetime import datetime, timedelta
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# lxml (libxml2, C) parses the feed far faster than the pure-Python
+# html.parser; fall back to the latter if lxml isn't installed.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 IQM2_RSS  = "https://sanramonca.iqm2.com/Services/RSS.aspx?Feed=Calendar"
 IQM2_BASE = "https://sanramonca.iqm2.com/Citizens"
+# No Accept-Encoding here: requests advertises gzip/deflate, plus br when the
+# brotli package (requirements.txt) is importable — hardcoding "br" would
+# break decoding on installs without it.
 HEADERS   = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Accept":     "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 TIMEOUT   = 15
-MAX_RETRIES = 2
+MAX_RETRIES = 2  # attempts, not retries
+
+
+def _make_session() -> requests.Session:
+    """
+    Keep-alive session for the feed: repeat fetches reuse the pooled TLS
+    connection, and urllib3 retries connection errors and 429/5xx responses
+    with backoff (honouring Retry-After).
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry = Retry(
+        total=MAX_RETRIES - 1,
+        backoff_factor=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+    return session
+
+
+_SESSION = _make_session()
+
+# Validators + parsed result of the last 200 response. The feed changes
+# rarely: within FEED_TTL the parsed meetings are reused without a request,
+# and after that fetches are conditional so a 304 still reuses `meetings`.
+FEED_TTL = 600
+_feed_cache: dict = {"etag": None, "last_modified": None, "meetings": None, "checked_at": 0.0}
+_NOT_MODIFIED = object()
+
+
+def expire_feed_cache() -> None:
+    """Makes the next fetch go to the server (still conditional)."""
+    _feed_cache["checked_at"] = 0.0
 
 
 def _abs(href: str | None) -> str | None:
@@ -42,17 +88,23 @@ def _abs(href: str | None) -> str | None:
     return f"{IQM2_BASE}/{href.lstrip('/')}"
 
 
+_DATE_RE = re.compile(
+    r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*"
+    r"\s+\d{1,2},\s+\d{4}(?:\s+\d{1,2}:\d{2}\s*(?:AM|PM))?)",
+    re.IGNORECASE,
+)
+_DATETIME_FMTS = ("%b %d, %Y %I:%M %p", "%B %d, %Y %I:%M %p")
+_DATE_FMTS     = ("%b %d, %Y", "%B %d, %Y")
+
+
 def _parse_date(heading: str) -> datetime | None:
     """Extracts and parses a date from an IQM2 RSS heading string."""
-    m = re.search(
-        r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*"
-        r"\s+\d{1,2},\s+\d{4}(?:\s+\d{1,2}:\d{2}\s*(?:AM|PM))?)",
-        heading, re.IGNORECASE,
-    )
+    m = _DATE_RE.search(heading)
     if not m:
         return None
     s = m.group(1).strip()
-    for fmt in ("%b %d, %Y %I:%M %p", "%B %d, %Y %I:%M %p", "%b %d, %Y", "%B %d, %Y"):
+    # Only the formats that can match: with a time of day or without
+    for fmt in (_DATETIME_FMTS if ":" in s else _DATE_FMTS):
         try:
             return datetime.strptime(s, fmt)
         except ValueError:
@@ -60,25 +112,34 @@ def _parse_date(heading: str) -> datetime | None:
     return None
 
 
-def _fetch_rss_html() -> str | None:
+def _fetch_rss_html():
     """
-    Fetches raw RSS HTML with retry logic.
-    BUG-15 FIX: retries once on failure with 2s backoff; surfaces error clearly.
+    Fetches raw RSS HTML over the shared session.
+    BUG-15 FIX: failed requests are retried with backoff (by the session's
+    adapter); the final error is surfaced clearly.
+    Sends If-None-Match / If-Modified-Since once a parsed feed is cached and
+    returns _NOT_MODIFIED on a 304.
     """
-    last_exc = None
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            resp = requests.get(IQM2_RSS, headers=HEADERS, timeout=TIMEOUT)
-            resp.raise_for_status()
-            logger.info(f"Scraper: RSS fetch OK ({len(resp.text):,} chars) on attempt {attempt}")
-            return resp.text
-        except Exception as e:
-            last_exc = e
-            logger.warning(f"Scraper: Attempt {attempt}/{MAX_RETRIES} failed — {e}")
-            if attempt < MAX_RETRIES:
-                time.sleep(2)
-    logger.error(f"Scraper: All {MAX_RETRIES} attempts failed. Last error: {last_exc}")
-    return None
+    headers = {}
+    if _feed_cache["meetings"] is not None:
+        if _feed_cache["etag"]:
+            headers["If-None-Match"] = _feed_cache["etag"]
+        if _feed_cache["last_modified"]:
+            headers["If-Modified-Since"] = _feed_cache["last_modified"]
+
+    try:
+        resp = _SESSION.get(IQM2_RSS, headers=headers, timeout=TIMEOUT)
+        if resp.status_code == 304:
+            logger.info("Scraper: RSS not modified — reusing parsed feed")
+            return _NOT_MODIFIED
+        resp.raise_for_status()
+    except Exception as e:
+        logger.error(f"Scraper: RSS fetch failed after {MAX_RETRIES} attempt(s) — {e}")
+        return None
+    logger.info(f"Scraper: RSS fetch OK ({len(resp.text):,} chars)")
+    _feed_cache["etag"]          = resp.headers.get("ETag")
+    _feed_cache["last_modified"] = resp.headers.get("Last-Modified")
+    return resp.text
 
 
 def _fetch_rss() -> list[dict]:
@@ -86,22 +147,31 @@ def _fetch_rss() -> list[dict]:
     Parses IQM2 RSS feed into structured meeting dicts.
     Groups Agenda / Minutes / Webcast entries by date into one record each.
     """
+    if _feed_cache["meetings"] is not None and time.monotonic() - _feed_cache["checked_at"] < FEED_TTL:
+        return list(_feed_cache["meetings"])
+
     html = _fetch_rss_html()
+    if html is _NOT_MODIFIED:
+        _feed_cache["checked_at"] = time.monotonic()
+        return list(_feed_cache["meetings"])
     if not html:
         return []
 
-    soup    = BeautifulSoup(html, "html.parser")
+    soup    = BeautifulSoup(html, HTML_PARSER)
     by_date: dict[str, dict] = {}
 
-    for div in soup.find_all("div"):
-        h2 = div.find("h2")
-        if not h2:
-            continue
+    # Walk the headings rather than every div: each feed item is a div
+    # around one h2, and most divs on the page have none.
+    for h2 in soup.find_all("h2"):
         heading = h2.get_text(strip=True)
 
         if "City Council" not in heading or "Cancelled" in heading:
             continue
 
+        div = h2.find_parent("div")
+        if div is None:
+            continue
+
         m_dt = _parse_date(heading)
         if not m_dt:
             logger.warning(f"Scraper: Could not parse date from: '{heading}'")
@@ -109,14 +179,6 @@ def _fetch_rss() -> list[dict]:
 
         iso = m_dt.strftime("%Y-%m-%d")
 
-        # Collect all valid links in this div block
-        # BUG-06 FIX: filter out None hrefs from _abs()
-        div_links = [
-            (a.get_text(strip=True), _abs(a["href"]))
-            for a in div.find_all("a", href=True)
-            if _abs(a["href"])  # exclude None/empty
-        ]
-
         if iso not in by_date:
             by_date[iso] = {
                 "name":        "City Council",
@@ -130,44 +192,60 @@ def _fetch_rss() -> list[dict]:
             }
 
         entry = by_date[iso]
-
-        if "- Agenda -" in heading:
-            for _, href in div_links:
+        kind  = (
+            "agenda"  if "- Agenda -"  in heading else
+            "minutes" if "- Minutes -" in heading else
+            "webcast" if "- Webcast -" in heading else
+            None
+        )
+
+        # One pass over the anchors per item, stopping once the fields this
+        # kind of item fills are found. Only links that can be used go
+        # through _abs() (BUG-06: it returns None for blank hrefs).
+        if kind == "agenda":
+            any_file = None  # fallback: first FileOpen link when none is Type=14
+            for a in div.find_all("a", href=True):
+                href = a["href"]
                 if "Detail_Meeting" in href and not entry["detail_url"]:
-                    entry["detail_url"] = href
-                if "FileOpen" in href and "Type=14" in href and not entry["agenda_url"]:
-                    entry["agenda_url"] = href
-            # Fallback: any FileOpen link
+                    entry["detail_url"] = _abs(href)
+                if "FileOpen" in href:
+                    if "Type=14" in href and not entry["agenda_url"]:
+                        entry["agenda_url"] = _abs(href)
+                    elif any_file is None:
+                        any_file = _abs(href)
+                if entry["detail_url"] and entry["agenda_url"]:
+                    break
             if not entry["agenda_url"]:
-                for _, href in div_links:
-                    if "FileOpen" in href:
-                        entry["agenda_url"] = href
-                        break
+                entry["agenda_url"] = any_file
 
-        elif "- Minutes -" in heading:
-            for _, href in div_links:
+        elif kind == "minutes":
+            alt = None  # fallback: link text containing "minute" or Type=16
+            for a in div.find_all("a", href=True):
+                href = a["href"]
                 if "FileOpen" in href:
-                    entry["minutes_url"] = href
+                    entry["minutes_url"] = _abs(href)
                     break
-            # Fallback: link text containing "minute" or Type=16
-            if not entry["minutes_url"]:
-                for text, href in div_links:
-                    if "minute" in text.lower() or "Type=16" in href:
-                        entry["minutes_url"] = href
-                        break
-
-        elif "- Webcast -" in heading:
+                if alt is None and ("Type=16" in href or "minute" in a.get_text(strip=True).lower()):
+                    alt = _abs(href)
+            else:
+                if not entry["minutes_url"]:
+                    entry["minutes_url"] = alt
+
+        elif kind == "webcast":
             entry["has_webcast"] = True
             # Use THIS entry's own Detail_Meeting link (different ID from Agenda)
-            for _, href in div_links:
-                if "Detail_Meeting" in href:
-                    entry["webcast_url"] = href
+            for a in div.find_all("a", href=True):
+                if "Detail_Meeting" in a["href"]:
+                    entry["webcast_url"] = _abs(a["href"])
                     break
 
-        logger.debug(f"Scraper: Processed '{heading[:65]}' → {iso}")
+        # %-args: formatted only if DEBUG is on — this runs once per feed item
+        logger.debug("Scraper: Processed '%s' → %s", heading[:65], iso)
 
     meetings = sorted(by_date.values(), key=lambda x: x["iso"], reverse=True)
     logger.info(f"Scraper: {len(meetings)} unique City Council meetings parsed from RSS")
+    _feed_cache["meetings"]   = meetings
+    _feed_cache["checked_at"] = time.monotonic()
     return meetings
 
 
@@ -21,35 +21,71 @@ Requirements:
 
 YouTube Data API v3 quota cost per analysis:
   channels.list  → 1 unit   (cached after first call per session)
-  search.list    → 100 units
-  Total: ~101 units per meeting (free tier = 10,000 units/day)
+  search.list    → 100 units for the exact-date query, plus 100 for the
+                   fallback query when that finds fewer than MIN_PRIMARY_HITS
+  Total: 101–201 units per meeting, 0 once its video ID or transcript is
+  cached on disk (free tier = 10,000 units/day)
 """
 
+import json
 import logging
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
 YT_API_BASE   = "https://www.googleapis.com/youtube/v3"
 MAX_CANDIDATES = 8
 MIN_SEGMENTS   = 20  # fewer than this → likely wrong/short video, skip
+MIN_PRIMARY_HITS = 3  # exact-date query results below this → also run the fallback
+
+# On-disk caches (not committed — see .gitignore)
+CACHE_DIR       = os.path.join(".cache", "youtube")
+_VID_CACHE_PATH = os.path.join(CACHE_DIR, "video_ids.json")
+_TRANSCRIPT_DIR = os.path.join(CACHE_DIR, "transcripts")
+TRANSCRIPT_TTL  = 7 * 86400  # a found transcript doesn't change
+MISS_TTL        = 3600       # "not found yet" — the upload may still be coming
+
+# Keep-alive session for the Data API: channels.list and the search queries
+# reuse one pooled connection instead of a TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 # ── Date formatting ───────────────────────────────────────────────────────────
 
+_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%m-%d-%Y", "%B %d, %Y", "%b %d, %Y")
+_DATE_SHAPES  = (
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), "%m/%d/%Y"),
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{1,2}-\d{1,2}-\d{4}"), "%m-%d-%Y"),
+)
+
+
+@lru_cache(maxsize=256)
 def _format_date_for_search(meeting_date: str) -> str:
     """
     Converts any date format to natural language for the search query.
     "02/10/2026" → "February 10 2026"
     "2026-02-10" → "February 10 2026"
     """
-    for fmt in ("%m/%d/%Y", "%Y-%m-%d", "%m-%d-%Y", "%B %d, %Y", "%b %d, %Y"):
+    raw  = meeting_date.strip()
+    fmts = _DATE_FORMATS
+    for shape, fmt in _DATE_SHAPES:
+        if shape.fullmatch(raw):
+            fmts = (fmt,)  # numeric shapes map to exactly one format
+            break
+    for fmt in fmts:
         try:
-            return datetime.strptime(meeting_date.strip(), fmt).strftime("%B %d %Y")
+            return datetime.strptime(raw, fmt).strftime("%B %d %Y")
         except ValueError:
             continue
     logger.warning(f"YouTube: Could not reformat date '{meeting_date}' — using as-is")
@@ -84,6 +120,7 @@ def _resolve_channel_id(handle: str, api_key: str) -> str | None:
     """
     Resolves a YouTube @handle to a channel ID via channels.list.
     Result is cached in-process so we only pay 1 API unit per session.
+    Request errors propagate, so a failed call isn't cached as "no channel".
 
     e.g. "SanRamonGovTV" → "UCxxxxxxxxxxxxxxxxxxxxxxxx"
     """
@@ -93,87 +130,310 @@ def _resolve_channel_id(handle: str, api_key: str) -> str | None:
         "forHandle": handle,
         "key":       api_key,
     }
+    resp = _SESSION.get(url, params=params, timeout=10)
+    resp.raise_for_status()
+    items = resp.json().get("items", [])
+    if not items:
+        logger.error(f"YouTube: Handle '@{handle}' resolved to no channel. "
+                     f"Check YOUTUBE_CHANNEL_HANDLE in .env.")
+        return None
+    channel_id = items[0]["id"]
+    logger.info(f"YouTube: @{handle} → channel ID {channel_id}")
+    return channel_id
+
+
+def _search_query(channel_id: str, query: str, api_key: str) -> list[tuple[str, str]] | None:
+    """
+    One search.list call; (video ID, title) in result order, or None if the
+    call failed (network, quota exhausted) — as opposed to [] for no results.
+    part=snippet costs the same 100 units as part=id and carries the title.
+    """
+    params = {
+        "part":       "snippet",
+        "channelId":  channel_id,
+        "q":          query,
+        "type":       "video",
+        "order":      "date",
+        "maxResults": MAX_CANDIDATES,
+        "key":        api_key,
+    }
+    logger.info(f"YouTube: API search → channelId={channel_id} q='{query}'")
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = _SESSION.get(f"{YT_API_BASE}/search", params=params, timeout=12)
         resp.raise_for_status()
-        data  = resp.json()
-        items = data.get("items", [])
-        if not items:
-            logger.error(f"YouTube: Handle '@{handle}' resolved to no channel. "
-                         f"Check YOUTUBE_CHANNEL_HANDLE in .env.")
-            return None
-        channel_id = items[0]["id"]
-        logger.info(f"YouTube: @{handle} → channel ID {channel_id}")
-        return channel_id
+        data = resp.json()
     except Exception as e:
-        logger.error(f"YouTube: channels.list failed for @{handle} — {e}")
+        logger.warning(f"YouTube: search.list failed for query '{query}' — {e}")
         return None
+    return [
+        (vid, item.get("snippet", {}).get("title", ""))
+        for item in data.get("items", [])
+        if (vid := item.get("id", {}).get("videoId"))
+    ]
+
 
+def _title_date_forms(natural: str) -> tuple[str, ...]:
+    """Ways a meeting date shows up in video titles, lowercased, commas dropped."""
+    try:
+        d = datetime.strptime(natural, "%B %d %Y")
+    except ValueError:
+        return (natural.lower(),)
+    return (
+        f"{d:%B} {d.day} {d.year}".lower(),
+        f"{d:%b} {d.day} {d.year}".lower(),
+        f"{d.month}/{d.day}/{d.year}",
+        f"{d:%m/%d/%Y}",
+        f"{d.month}/{d.day}/{d:%y}",
+        f"{d:%Y-%m-%d}",
+    )
 
-def _search_channel(channel_id: str, date_str: str, api_key: str) -> list[str]:
+
+def _rank(found: list[tuple[str, str]], natural: str) -> list[str]:
+    """
+    Deduplicated video IDs, best title match first: the meeting date in the
+    title outranks "council", which outranks neither. Ties keep search order.
+    Transcripts are fetched in this order, so the right video is usually
+    the first fetch.
+    """
+    date_re = re.compile("|".join(rf"(?<![\w/]){re.escape(f)}(?![\w/])" for f in _title_date_forms(natural)))
+    titles: dict[str, str] = {}
+    for vid, title in found:
+        titles.setdefault(vid, title)
+
+    def score(vid: str) -> int:
+        title = " ".join(titles[vid].lower().replace(",", " ").split())
+        return 2 * bool(date_re.search(title)) + ("council" in title)
+
+    results = sorted(titles, key=score, reverse=True)[:MAX_CANDIDATES]
+    if len(results) >= MAX_CANDIDATES:
+        logger.info(f"YouTube: Reached MAX_CANDIDATES={MAX_CANDIDATES}")
+    return results
+
+
+def _search_channel(channel_id: str, date_str: str, api_key: str) -> tuple[list[str], bool]:
     """
     Searches a specific channel for council meeting videos matching the date.
-    Returns up to MAX_CANDIDATES deduplicated video IDs.
+    Returns (up to MAX_CANDIDATES deduplicated video IDs, best title match
+    first; whether every query sent succeeded).
 
     Uses search.list (100 quota units) scoped to channelId so we only
     get videos from the official city channel — no irrelevant results.
+    The exact-date query runs alone since it usually finds the video; only
+    if it yields fewer than MIN_PRIMARY_HITS videos is the broader fallback
+    sent, and its results pooled with it before ranking.
     """
     natural = _format_date_for_search(date_str)
 
-    # Two query variants: exact date phrase first, then broader fallback
-    queries = [
-        f"City Council Meeting {natural}",
-        f"City Council {natural}",
-        "City Council Meeting",   # fallback: latest meetings if date not in title
-    ]
+    # Exact date phrase first, then a broader one
+    primary  = f"City Council Meeting {natural}"
+    fallback = f"City Council {natural}"
+
+    first = _search_query(channel_id, primary, api_key)
+    ok    = first is not None
+    found = first or []
+    if len(dict.fromkeys(vid for vid, _ in found)) < MIN_PRIMARY_HITS:
+        more  = _search_query(channel_id, fallback, api_key)
+        ok    = ok and more is not None
+        found = found + (more or [])
+    results = _rank(found, natural)
+
+    logger.info(f"YouTube: Total candidates: {results}")
+    return results, ok
+
+
+# ── Video-ID cache ────────────────────────────────────────────────────────────
+# A meeting's video never changes once found, so {meeting date: video ID} is
+# kept on disk and a repeat fetch skips channels.list + search.list entirely.
+
+_vid_lock  = threading.Lock()
+_vid_cache: dict[str, str] | None = None
 
-    seen, results = set(), []
-
-    for query in queries:
-        params = {
-            "part":       "id",
-            "channelId":  channel_id,
-            "q":          query,
-            "type":       "video",
-            "order":      "date",
-            "maxResults": MAX_CANDIDATES,
-            "key":        api_key,
-        }
-        logger.info(f"YouTube: API search → channelId={channel_id} q='{query}'")
+
+def _load_video_ids() -> dict[str, str]:
+    global _vid_cache
+    if _vid_cache is None:
         try:
-            resp = requests.get(f"{YT_API_BASE}/search", params=params, timeout=12)
-            resp.raise_for_status()
-            data = resp.json()
-
-            for item in data.get("items", []):
-                vid = item.get("id", {}).get("videoId")
-                if vid and vid not in seen:
-                    seen.add(vid)
-                    results.append(vid)
-                    if len(results) >= MAX_CANDIDATES:
-                        logger.info(f"YouTube: Reached MAX_CANDIDATES={MAX_CANDIDATES}")
-                        return results
-
-        except Exception as e:
-            logger.warning(f"YouTube: search.list failed for query '{query}' — {e}")
-            continue
+            with open(_VID_CACHE_PATH, encoding="utf-8") as f:
+                _vid_cache = json.load(f)
+        except (OSError, ValueError):
+            _vid_cache = {}
+    return _vid_cache
 
-        # If we already have strong candidates from the first query, stop early
-        if results:
-            logger.info(f"YouTube: {len(results)} candidate(s) found, stopping search")
-            break
 
-    logger.info(f"YouTube: Total candidates: {results}")
-    return results
+def _cached_video_id(date_key: str) -> str | None:
+    with _vid_lock:
+        return _load_video_ids().get(date_key)
+
+
+def _remember_video_id(date_key: str, video_id: str) -> None:
+    """Records the mapping and rewrites the file atomically (tmp + replace)."""
+    with _vid_lock:
+        ids = _load_video_ids()
+        if ids.get(date_key) == video_id:
+            return
+        ids[date_key] = video_id
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{_VID_CACHE_PATH}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(ids, f, indent=0, sort_keys=True)
+            os.replace(tmp, _VID_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"YouTube: Could not persist video-ID cache — {e}")
+
+
+# youtube-transcript-api errors that settle it: this video has no usable
+# transcript (yet). Anything else — network trouble, rate limits, IP blocks —
+# is worth retrying. Matched by name since the package is imported lazily.
+_NO_TRANSCRIPT_ERRORS = frozenset({
+    "TranscriptsDisabled", "NoTranscriptFound", "NoTranscriptAvailable",
+    "VideoUnavailable", "VideoUnplayable", "InvalidVideoId", "AgeRestricted",
+})
+
+
+def _fetch_segments(api, video_id: str) -> tuple[list[dict] | None, bool]:
+    """
+    (segments, settled) for one video. segments is None if unavailable or too
+    short; settled is False when the fetch failed in a way worth retrying.
+    """
+    logger.info(f"YouTube: Attempting transcript for {video_id}")
+    try:
+        fetched  = api.fetch(video_id)
+        # Strip once and keep the stripped text; whitespace-only pieces drop out
+        segments = [
+            {"text": text, "start": e.start, "duration": e.duration}
+            for e in fetched
+            if e.text and (text := e.text.strip())
+        ]
+    except Exception as e:
+        exc_type = type(e).__name__
+        logger.warning(f"YouTube: {video_id} failed ({exc_type}) — {e}")
+        return None, exc_type in _NO_TRANSCRIPT_ERRORS
+
+    if len(segments) < MIN_SEGMENTS:
+        logger.warning(
+            f"YouTube: {video_id} only has {len(segments)} segments "
+            f"(min={MIN_SEGMENTS}) — likely wrong video, skipping"
+        )
+        return None, True
+
+    logger.info(f"YouTube: ✓ {len(segments):,} segments from {video_id}")
+    return segments, True
+
+
+@lru_cache(maxsize=1)
+def _transcript_api():
+    """
+    One YouTubeTranscriptApi per process, on its own keep-alive session, or
+    None if the package isn't installed (imported here so the app still
+    starts without it).
+    """
+    try:
+        from youtube_transcript_api import YouTubeTranscriptApi
+    except ImportError:
+        return None
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_WORKERS))
+    try:
+        return YouTubeTranscriptApi(http_client=session)
+    except TypeError:  # releases before http_client was accepted
+        return YouTubeTranscriptApi()
+
+
+FETCH_WORKERS = 4
+
+
+def _first_transcript(api, candidates: list[str]) -> tuple[str | None, list[dict] | None, bool]:
+    """
+    The first candidate, in search order, with a usable transcript, as
+    (video ID, segments, settled) — settled is False if any fetch failed in a
+    way worth retrying. The top result is usually right, so it is tried
+    alone; only if it fails are the rest fetched concurrently (FETCH_WORKERS
+    at a time). Search order still decides the winner, and fetches not yet
+    started are cancelled once it's known.
+    """
+    if not candidates:
+        return None, None, True
+    segments, settled = _fetch_segments(api, candidates[0])
+    if segments or len(candidates) == 1:
+        return candidates[0], segments, settled
+
+    rest = candidates[1:]
+    pool = ThreadPoolExecutor(max_workers=min(len(rest), FETCH_WORKERS), thread_name_prefix="yt-fetch")
+    try:
+        futures = [pool.submit(_fetch_segments, api, vid) for vid in rest]
+        for vid, future in zip(rest, futures):
+            segments, ok = future.result()
+            if segments:
+                return vid, segments, True
+            settled = settled and ok
+        return None, None, settled
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ── Transcript cache ──────────────────────────────────────────────────────────
+# One JSON file per meeting date: {"saved_at": epoch, "segments": [...] | null}.
+# A definitive miss is stored too, with the short MISS_TTL, so a meeting whose
+# video isn't up yet doesn't re-run the searches on every click.
+
+def _transcript_path(date_key: str) -> str:
+    return os.path.join(_TRANSCRIPT_DIR, re.sub(r"[^A-Za-z0-9]+", "_", date_key) + ".json")
+
+
+def _read_cached_transcript(date_key: str) -> tuple[bool, list[dict] | None]:
+    """(hit, segments); hit is False when absent, unreadable or expired."""
+    try:
+        with open(_transcript_path(date_key), encoding="utf-8") as f:
+            entry = json.load(f)
+        segments = entry["segments"]
+        ttl      = TRANSCRIPT_TTL if segments else MISS_TTL
+        if time.time() - entry["saved_at"] > ttl:
+            return False, None
+        return True, segments
+    except (OSError, ValueError, KeyError, TypeError):
+        return False, None
+
+
+def _write_cached_transcript(date_key: str, segments: list[dict] | None) -> None:
+    path = _transcript_path(date_key)
+    tmp  = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(_TRANSCRIPT_DIR, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "segments": segments}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"YouTube: Could not cache transcript for '{date_key}' — {e}")
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def get_transcript(meeting_date: str) -> list[dict] | None:
+    """
+    get_transcript_uncached() behind an on-disk cache: a found transcript is
+    reused for TRANSCRIPT_TTL, a miss for MISS_TTL. Only definitive misses
+    are cached — every search succeeded and no candidate has a transcript —
+    never ones caused by configuration, quota or network errors.
+    """
+    date_key = _format_date_for_search(meeting_date)
+    hit, segments = _read_cached_transcript(date_key)
+    if hit:
+        logger.info(f"YouTube: Transcript cache hit for '{meeting_date}' ({'found' if segments else 'miss'})")
+        return segments
+
+    segments, settled = _fetch_transcript(meeting_date)
+    if segments or settled:
+        _write_cached_transcript(date_key, segments)
+    return segments
+
+
+def get_transcript_uncached(meeting_date: str) -> list[dict] | None:
     """
     Fetches the YouTube transcript for a given meeting date.
 
     Pipeline:
+      0. If a video for this date was found before, try it first (no API calls)
       1. Read YOUTUBE_API_KEY and YOUTUBE_CHANNEL_HANDLE from env
       2. Resolve @handle → channel ID (cached)
       3. Search that channel for the date
@@ -182,8 +442,32 @@ def get_transcript(meeting_date: str) -> list[dict] | None:
 
     Falls back gracefully at each step with clear error messages.
     """
+    return _fetch_transcript(meeting_date)[0]
+
+
+def _fetch_transcript(meeting_date: str) -> tuple[list[dict] | None, bool]:
+    """
+    get_transcript_uncached() as (segments, settled): settled is True when
+    the outcome can be cached — a transcript was found, or every search and
+    fetch succeeded without finding one.
+    """
     logger.info(f"YouTube: Transcript fetch requested for '{meeting_date}'")
 
+    api = _transcript_api()
+    if api is None:
+        logger.error("YouTube: youtube-transcript-api not installed. Run: pip install youtube-transcript-api")
+        return None, False
+
+    date_key = _format_date_for_search(meeting_date)
+    known    = _cached_video_id(date_key)
+    if known:
+        logger.info(f"YouTube: Cached video {known} for '{meeting_date}'")
+        segments, settled = _fetch_segments(api, known)
+        if segments:
+            return segments, True
+    else:
+        settled = True
+
     api_key = _get_api_key()
     if not api_key:
         logger.error(
@@ -192,58 +476,49 @@ def get_transcript(meeting_date: str) -> list[dict] | None:
             "Get a free key at https://console.cloud.google.com/ "
             "(enable YouTube Data API v3, free tier = 10,000 units/day)."
         )
-        return None
+        return None, False
 
-    handle     = _get_channel_handle()
-    channel_id = _resolve_channel_id(handle, api_key)
+    handle = _get_channel_handle()
+    try:
+        channel_id = _resolve_channel_id(handle, api_key)
+    except Exception as e:
+        logger.error(f"YouTube: channels.list failed for @{handle} — {e}")
+        return None, False
     if not channel_id:
-        return None
+        return None, False
 
-    candidates = _search_channel(channel_id, meeting_date, api_key)
+    candidates, searched = _search_channel(channel_id, meeting_date, api_key)
+    settled = settled and searched
     if not candidates:
         logger.error(
             f"YouTube: No videos found in channel @{handle} for '{meeting_date}'. "
             "The video may not be uploaded yet (usually 1–2 days after the meeting)."
         )
-        return None
+        return None, settled
 
-    # Lazy import so app doesn't crash if package not installed
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
-    except ImportError:
-        logger.error("YouTube: youtube-transcript-api not installed. Run: pip install youtube-transcript-api")
-        return None
-
-    api = YouTubeTranscriptApi()
-
-    for video_id in candidates:
-        logger.info(f"YouTube: Attempting transcript for {video_id}")
-        try:
-            fetched  = api.fetch(video_id)
-            segments = [
-                {"text": e.text, "start": e.start, "duration": e.duration}
-                for e in fetched
-                if e.text and e.text.strip()
-            ]
-
-            if len(segments) < MIN_SEGMENTS:
-                logger.warning(
-                    f"YouTube: {video_id} only has {len(segments)} segments "
-                    f"(min={MIN_SEGMENTS}) — likely wrong video, skipping"
-                )
-                continue
-
-            logger.info(f"YouTube: ✓ {len(segments):,} segments from {video_id}")
-            return segments
-
-        except Exception as e:
-            exc_type = type(e).__name__
-            logger.warning(f"YouTube: {video_id} failed ({exc_type}) — {e}")
-            continue
+    candidates = [v for v in candidates if v != known]  # known was tried above
+    video_id, segments, fetched = _first_transcript(api, candidates)
+    if segments:
+        _remember_video_id(date_key, video_id)
+        return segments, True
 
     logger.error(
         f"YouTube: All {len(candidates)} candidate(s) exhausted. "
         f"Transcript not available for '{meeting_date}'. "
         "Auto-captions may not be generated yet — check back in 24 hours."
     )
-    return None
+    return None, settled and fetched
+
+
+def get_transcripts_many(meeting_dates: list[str], max_workers: int = 8) -> dict[str, list[dict] | None]:
+    """
+    get_transcript() for several meetings at once, e.g. for an evaluation
+    run. Each fetch is network-bound, so threads overlap the searches and
+    transcript downloads; max_workers bounds the load on YouTube.
+    Returns {meeting_date: segments or None}.
+    """
+    dates = list(dict.fromkeys(meeting_dates))
+    if not dates:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(dates), max_workers), thread_name_prefix="yt") as pool:
+        return dict(zip(dates, pool.map(get_transcript, dates)))